@@ -8,8 +8,9 @@ import sys
 
 from playwright.sync_api import expect, sync_playwright
 
+from e2e.common.browser import launch_browser
 from e2e.common.config import get_config
-from e2e.common.helpers import expand_sidebar, take_screenshot
+from e2e.common.helpers import expand_sidebar, print_screenshot_location, take_screenshot
 
 config = get_config()
 BASE_URL = config["admin_web_url"]
@@ -20,7 +21,7 @@ PASSWORD = config["admin_password"]
 def test_auth_flow():
     """Test complete authentication flow including login, logout, and token handling"""
     with sync_playwright() as p:
-        browser = p.chromium.launch(headless=config["headless"])
+        browser = launch_browser(p)
         context = browser.new_context(ignore_https_errors=config.get("ignore_https_errors", False))
         page = context.new_page()
 
@@ -282,9 +283,7 @@ def test_auth_flow():
             print("  [PASS] Access denied after logout")
             print("  [PASS] All protected pages require authentication")
             print("  [PASS] Re-login after logout")
-            print("\nScreenshots saved to /tmp/:")
-            for i in range(1, 12):
-                print(f"  - auth_{i:02d}_*.png")
+            print_screenshot_location("auth")
 
             return True
 
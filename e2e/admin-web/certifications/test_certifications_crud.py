@@ -10,6 +10,7 @@ import time
 from playwright.sync_api import expect, sync_playwright
 
 from e2e.auth.auth_manager import AuthManager
+from e2e.common.browser import launch_browser
 from e2e.common.config import get_config
 from e2e.common.helpers import (
     clear_search,
@@ -21,6 +22,7 @@ from e2e.common.helpers import (
     navigate_to_page,
     open_add_modal,
     open_edit_modal,
+    print_screenshot_location,
     save_modal,
     search_and_verify,
     search_table,
@@ -28,6 +30,7 @@ from e2e.common.helpers import (
     verify_cell_contains,
     verify_row_not_exists,
     wait_for_page_load,
+    worker_suffix,
 )
 
 config = get_config()
@@ -38,7 +41,7 @@ def test_certifications_crud():
     """Test Certifications page full CRUD operations"""
     with sync_playwright() as p:
         auth_manager = AuthManager()
-        browser = p.chromium.launch(headless=config["headless"])
+        browser = launch_browser(p)
         page, context = auth_manager.authenticate(browser, strategy="auto")
 
         if not page:
@@ -48,9 +51,9 @@ def test_certifications_crud():
         print("\n=== CERTIFICATIONS E2E TEST ===\n")
 
         # Test data - unique certification name using timestamp
-        test_name = f"E2E Test Certification {int(time.time())}"
+        test_name = f"E2E Test Certification {int(time.time())}{worker_suffix()}"
         test_issuer = "E2E Testing Authority"
-        test_credential_id = f"CERT-E2E-{int(time.time())}"
+        test_credential_id = f"CERT-E2E-{int(time.time())}{worker_suffix()}"
         test_credential_url = "https://example.com/verify"
         test_issue_date = "2024-01-15"
         test_expiry_date = "2027-01-15"
@@ -292,7 +295,7 @@ def test_certifications_crud():
             print("  [PASS] Date validation (expiry after issue)")
             print("  [PASS] Delete certification")
             print("  [PASS] Verify deletion")
-            print("\nScreenshots saved to /tmp/test_certifications_*.png")
+            print_screenshot_location("certifications")
 
             return True
 
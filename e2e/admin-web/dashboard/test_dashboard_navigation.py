@@ -9,8 +9,14 @@ import sys
 from playwright.sync_api import expect, sync_playwright
 
 from e2e.auth.auth_manager import AuthManager
+from e2e.common.browser import launch_browser
 from e2e.common.config import get_config
-from e2e.common.helpers import click_dashboard_card_button, find_dashboard_card, take_screenshot
+from e2e.common.helpers import (
+    click_dashboard_card_button,
+    find_dashboard_card,
+    print_screenshot_location,
+    take_screenshot,
+)
 
 config = get_config()
 BASE_URL = config["admin_web_url"]
@@ -27,7 +33,7 @@ def test_dashboard_navigation():
     """Test Dashboard page layout and navigation to all feature pages"""
     with sync_playwright() as p:
         auth_manager = AuthManager()
-        browser = p.chromium.launch(headless=config["headless"])
+        browser = launch_browser(p)
         page, context = auth_manager.authenticate(browser, strategy="auto")
 
         if not page:
@@ -145,7 +151,7 @@ def test_dashboard_navigation():
             print("  [PASS] Navigation to Messaging")
             print("  [PASS] Return to Dashboard")
             print("  [PASS] Root URL redirect")
-            print("\nScreenshots saved to /tmp/test_dashboard_*.png")
+            print_screenshot_location("dashboard")
 
             return True
 
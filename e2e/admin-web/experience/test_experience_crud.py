@@ -10,6 +10,7 @@ import time
 from playwright.sync_api import expect, sync_playwright
 
 from e2e.auth.auth_manager import AuthManager
+from e2e.common.browser import launch_browser
 from e2e.common.config import get_config
 from e2e.common.helpers import (
     clear_search,
@@ -21,6 +22,7 @@ from e2e.common.helpers import (
     navigate_to_page,
     open_add_modal,
     open_edit_modal,
+    print_screenshot_location,
     save_modal,
     search_and_verify,
     search_table,
@@ -28,6 +30,7 @@ from e2e.common.helpers import (
     verify_cell_contains,
     verify_row_not_exists,
     wait_for_page_load,
+    worker_suffix,
 )
 
 config = get_config()
@@ -100,7 +103,7 @@ def test_experience_crud():
     """Test Work Experience page CRUD operations"""
     with sync_playwright() as p:
         auth_manager = AuthManager()
-        browser = p.chromium.launch(headless=config["headless"])
+        browser = launch_browser(p)
         page, context = auth_manager.authenticate(browser, strategy="auto")
 
         if not page:
@@ -110,7 +113,7 @@ def test_experience_crud():
         print("\n=== WORK EXPERIENCE E2E TEST ===\n")
 
         # Test data
-        test_company = f"E2E Test Company {int(time.time())}"
+        test_company = f"E2E Test Company {int(time.time())}{worker_suffix()}"
         test_position = "Senior Test Engineer"
         test_description = "Automated E2E testing and quality assurance"
         test_start_date = "2024-01"
@@ -371,7 +374,7 @@ def test_experience_crud():
             print("  [PASS] Delete work experience")
             print("  [PASS] Verify deletion")
             print("  [PASS] Verify deletion persists after reload")
-            print("\nScreenshots saved to /tmp/test_experience_*.png")
+            print_screenshot_location("experience")
 
             return True
 
@@ -10,6 +10,7 @@ import time
 from playwright.sync_api import expect, sync_playwright
 
 from e2e.auth.auth_manager import AuthManager
+from e2e.common.browser import launch_browser
 from e2e.common.config import get_config
 from e2e.common.helpers import (
     clear_search,
@@ -19,13 +20,16 @@ from e2e.common.helpers import (
     navigate_to_tab,
     open_add_modal,
     open_edit_modal,
+    print_screenshot_location,
     save_modal,
     search_and_verify,
     search_table,
+    switch_tab,
     take_screenshot,
     verify_cell_contains,
     verify_row_not_exists,
     wait_for_page_load,
+    worker_suffix,
 )
 
 config = get_config()
@@ -79,7 +83,7 @@ def test_messaging_crud():
     """Test Messaging page full CRUD operations"""
     with sync_playwright() as p:
         auth_manager = AuthManager()
-        browser = p.chromium.launch(headless=config["headless"])
+        browser = launch_browser(p)
         page, context = auth_manager.authenticate(browser, strategy="auto")
 
         if not page:
@@ -89,7 +93,7 @@ def test_messaging_crud():
         print("\n=== MESSAGING E2E TEST ===\n")
 
         # Test data - unique recipient using timestamp
-        timestamp = int(time.time())
+        timestamp = f"{int(time.time())}{worker_suffix()}"
         test_email = f"e2e-test-{timestamp}@example.com"
         test_name = f"E2E Test Recipient {timestamp}"
 
@@ -285,9 +289,7 @@ def test_messaging_crud():
             # STEP 10: Navigate to Messages tab
             # ========================================
             print("\n10. Navigating to Messages tab...")
-            messages_tab = page.locator('.n-tabs-tab:has-text("Messages")').first
-            messages_tab.click()
-            page.wait_for_timeout(500)
+            switch_tab(page, "Messages")
             take_screenshot(page, "messaging_10_messages_tab", "Messages tab loaded")
             print("   [OK] Messages tab loaded")
 
@@ -364,9 +366,7 @@ def test_messaging_crud():
             # STEP 13: Navigate back to Recipients tab
             # ========================================
             print("\n13. Navigating back to Recipients tab...")
-            recipients_tab = page.locator('.n-tabs-tab:has-text("Recipients")').first
-            recipients_tab.click()
-            page.wait_for_timeout(500)
+            switch_tab(page, "Recipients")
             print("   [OK] Recipients tab loaded")
 
             # ========================================
@@ -412,7 +412,7 @@ def test_messaging_crud():
             print("  [PASS] Messages search functionality (if messages exist)")
             print("  [PASS] Delete recipient")
             print("  [PASS] Verify deletion")
-            print("\nScreenshots saved to /tmp/test_messaging_*.png")
+            print_screenshot_location("messaging")
 
         except AssertionError as e:
             print(f"\n[ASSERTION ERROR] {e}")
@@ -5,99 +5,113 @@ Tests: Validation, Create, Edit, Search, Persistence, Delete
 """
 
 import sys
-import time
+from dataclasses import dataclass
 
-from playwright.sync_api import expect, sync_playwright
+from playwright.sync_api import expect
 
-from e2e.auth.auth_manager import AuthManager
 from e2e.common.config import get_config
 from e2e.common.helpers import (
-    clear_search,
+    buffer_stdout,
     close_modal,
-    delete_row,
     fill_color_picker,
     fill_text_input,
     navigate_to_tab,
     open_add_modal,
     open_edit_modal,
+    print_screenshot_location,
+    print_timing_summary,
     save_modal,
+    search_and_delete,
     search_and_verify,
     search_table,
     select_dropdown_option,
+    submit_empty_form,
     take_screenshot,
-    verify_row_not_exists,
-    wait_for_page_load,
+    take_step_screenshot,
+    timed,
+    unique_name,
+    verify_api_record_exists,
+    verify_created_row,
+    verify_row_deleted,
 )
+from e2e.common.runner import run_standalone
 
 config = get_config()
 BASE_URL = config["admin_web_url"]
+API_URL = config["admin_api_url"]
 
 
-def test_paints_crud():
+@dataclass(frozen=True, slots=True)
+class PaintTestData:
+    """Paint field values used by the CRUD test"""
+
+    name: str
+    manufacturer: str
+    color_hex: str
+    updated_name: str
+    updated_manufacturer: str
+    updated_color_hex: str
+
+
+def make_test_data() -> PaintTestData:
+    """Build test data with a paint name unique per run and xdist worker"""
+    name = unique_name("E2E Test Paint")
+    return PaintTestData(
+        name=name,
+        manufacturer="Citadel",
+        color_hex="#FF5733",
+        updated_name=f"{name} Updated",
+        updated_manufacturer="Vallejo",
+        updated_color_hex="#33C1FF",
+    )
+
+
+def test_paints_crud(authed_context):
     """Test Miniatures Paints tab full CRUD operations"""
-    with sync_playwright() as p:
-        auth_manager = AuthManager()
-        browser = p.chromium.launch(headless=config["headless"])
-        page, context = auth_manager.authenticate(browser, strategy="auto")
-
-        if not page:
-            print("[ERROR] Authentication failed")
-            return False
-
-        print("\n=== MINIATURES PAINTS E2E TEST ===\n")
-
-        # Test data - unique paint name using timestamp
-        test_paint_name = f"E2E Test Paint {int(time.time())}"
-        test_manufacturer = "Citadel"
-        test_color_hex = "#FF5733"
-
-        updated_paint_name = f"{test_paint_name} Updated"
-        updated_manufacturer = "Vallejo"
-        updated_color_hex = "#33C1FF"
-
-        try:
-            # ========================================
-            # STEP 1: Navigate to Miniatures > Paints tab
-            # ========================================
+    data = make_test_data()
+    timings: dict[str, float] = {}
+    page = authed_context.new_page()
+
+    print("\n=== MINIATURES PAINTS E2E TEST ===\n")
+
+    try:
+        # ========================================
+        # STEP 1: Navigate to Miniatures > Paints tab
+        # ========================================
+        with timed("Step 1: Navigate to Miniatures > Paints tab", timings):
             print("1. Navigating to Miniatures > Paints tab...")
             navigate_to_tab(page, BASE_URL, "miniatures", "Paints")
-            take_screenshot(page, "paints_01_page", "Paints tab loaded")
+            take_step_screenshot(page, "paints_01_page", "Paints tab loaded")
             print("   [OK] Paints tab loaded")
 
-            # ========================================
-            # STEP 2: Test validation - empty form
-            # ========================================
+        # ========================================
+        # STEP 2: Test validation - empty form
+        # ========================================
+        with timed("Step 2: Test validation - empty form", timings):
             print("\n2. Testing validation - empty paint form...")
-            modal = open_add_modal(page, "Add Paint")
-            print("   [OK] Add Paint modal opened")
-
-            # Try to save without filling required fields
-            save_modal(page)
-
-            # Modal should remain open due to validation
-            assert modal.is_visible(), "Modal should remain open on validation error"
-            print("   [OK] Validation prevents empty paint form submission")
-            take_screenshot(page, "paints_02_validation_error", "Validation error shown")
+            submit_empty_form(page, "Add Paint", "paint")
+            take_step_screenshot(page, "paints_02_validation_error", "Validation error shown")
 
             # Close modal
             close_modal(page)
             print("   [OK] Modal closed")
 
-            # ========================================
-            # STEP 3: Create new paint
-            # ========================================
-            print(f"\n3. Creating new paint: '{test_paint_name}'...")
+        # ========================================
+        # STEP 3: Create new paint
+        # ========================================
+        with timed("Step 3: Create new paint", timings):
+            print(f"\n3. Creating new paint: '{data.name}'...")
             modal = open_add_modal(page, "Add Paint")
 
             # Fill form fields
-            fill_text_input(page, label="Paint Name", value=test_paint_name)
-            fill_text_input(page, label="Manufacturer", value=test_manufacturer)
+            fill_text_input(page, label="Paint Name", value=data.name)
+            fill_text_input(page, label="Manufacturer", value=data.manufacturer)
             select_dropdown_option(page, modal, option_index=0, label="Paint Type")
             print("   [OK] Paint type selected")
-            fill_color_picker(page, modal, test_color_hex, label="Color (Hex)")
+            fill_color_picker(page, modal, data.color_hex, label="Color (Hex)")
             print("   [OK] Color selected")
 
-            take_screenshot(page, "paints_03_create_form_filled", "Create form filled")
+            take_step_screenshot(page, "paints_03_create_form_filled", "Create form filled")
 
             # Save
             save_modal(page)
@@ -106,40 +120,40 @@ def test_paints_crud():
             assert not modal.is_visible(), "Modal should close after successful save"
             print("   [OK] Paint created successfully")
 
-            # ========================================
-            # STEP 4: Verify entry appears in table
-            # ========================================
+        # ========================================
+        # STEP 4: Verify entry appears in table
+        # ========================================
+        with timed("Step 4: Verify entry appears in table", timings):
             print("\n4. Verifying paint appears in table...")
             page.wait_for_timeout(500)
 
             # Search and verify the new paint
-            search_and_verify(page, test_paint_name, "paint")
-
-            clear_search(page)
-            take_screenshot(page, "paints_04_in_table", "Paint in table")
+            verify_created_row(page, data.name, "paint")
+            take_step_screenshot(page, "paints_04_in_table", "Paint in table")
 
-            # ========================================
-            # STEP 5: Edit paint entry
-            # ========================================
+        # ========================================
+        # STEP 5: Edit paint entry
+        # ========================================
+        with timed("Step 5: Edit paint entry", timings):
             print("\n5. Editing paint entry...")
 
             # Search to find the paint
-            search_table(page, test_paint_name)
+            search_table(page, data.name)
 
-            modal = open_edit_modal(page, test_paint_name)
+            modal = open_edit_modal(page, data.name)
             print("   [OK] Edit modal opened")
 
             # Verify existing data loaded
             name_input = page.locator('input[placeholder*="paint name" i]').first
-            expect(name_input).to_have_value(test_paint_name)
+            expect(name_input).to_have_value(data.name)
             print("   [OK] Existing data loaded")
 
             # Update form fields
-            fill_text_input(page, label="Paint Name", value=updated_paint_name)
-            fill_text_input(page, label="Manufacturer", value=updated_manufacturer)
-            fill_color_picker(page, modal, updated_color_hex, label="Color (Hex)")
+            fill_text_input(page, label="Paint Name", value=data.updated_name)
+            fill_text_input(page, label="Manufacturer", value=data.updated_manufacturer)
+            fill_color_picker(page, modal, data.updated_color_hex, label="Color (Hex)")
 
-            take_screenshot(page, "paints_05_edit_form_filled", "Edit form filled")
+            take_step_screenshot(page, "paints_05_edit_form_filled", "Edit form filled")
 
             # Save changes
             save_modal(page)
@@ -148,103 +162,82 @@ def test_paints_crud():
             assert not modal.is_visible(), "Modal should close after successful update"
             print("   [OK] Paint updated successfully")
 
-            # ========================================
-            # STEP 6: Test search functionality
-            # ========================================
+        # ========================================
+        # STEP 6: Test search functionality
+        # ========================================
+        with timed("Step 6: Test search functionality", timings):
             print("\n6. Testing search functionality...")
 
             # Search by paint name
-            clear_search(page)
-            search_and_verify(page, updated_paint_name, "paint")
-            print(f"   [OK] Search by name found: '{updated_paint_name}'")
-            take_screenshot(page, "paints_06a_search_by_name", "Search by name")
+            search_and_verify(page, data.updated_name, "paint")
+            print(f"   [OK] Search by name found: '{data.updated_name}'")
+            take_step_screenshot(page, "paints_06a_search_by_name", "Search by name")
 
             # Search by manufacturer
-            clear_search(page)
-            search_and_verify(page, updated_manufacturer, "paint")
-            print(f"   [OK] Search by manufacturer found: '{updated_manufacturer}'")
-            take_screenshot(page, "paints_06b_search_by_manufacturer", "Search by manufacturer")
-
-            # ========================================
-            # STEP 7: Test data persistence - reload page
-            # ========================================
-            print("\n7. Testing data persistence - reloading page...")
-            page.reload()
-            wait_for_page_load(page)
-            page.wait_for_timeout(500)
-
-            # Navigate back to Paints tab
-            navigate_to_tab(page, BASE_URL, "miniatures", "Paints")
-
-            # Search and verify persistence
-            search_and_verify(page, updated_paint_name, "paint")
-            print("   [OK] Paint data persisted after reload")
-
-            clear_search(page)
-            take_screenshot(page, "paints_07_persisted", "Data persisted after reload")
-
-            # ========================================
-            # STEP 8: Delete paint entry
-            # ========================================
-            print(f"\n8. Deleting paint '{updated_paint_name}'...")
-
-            search_table(page, updated_paint_name)
-            delete_row(page, updated_paint_name)
-            print("   [OK] Deletion confirmed")
-
-            # ========================================
-            # STEP 9: Verify deletion
-            # ========================================
+            search_and_verify(page, data.updated_manufacturer, "paint")
+            print(f"   [OK] Search by manufacturer found: '{data.updated_manufacturer}'")
+            take_step_screenshot(
+                page, "paints_06b_search_by_manufacturer", "Search by manufacturer"
+            )
+
+        # ========================================
+        # STEP 7: Test data persistence - query the API
+        # ========================================
+        with timed("Step 7: Test data persistence - query the API", timings):
+            print("\n7. Testing data persistence - querying admin API...")
+            paint = verify_api_record_exists(
+                page, API_URL, "miniatures/paints", data.updated_name, entity_name="paint"
+            )
+            assert (
+                paint.get("manufacturer") == data.updated_manufacturer
+            ), "Updated manufacturer should be persisted"
+            print("   [OK] Paint data persisted in backend")
+
+        # ========================================
+        # STEP 8: Delete paint entry
+        # ========================================
+        with timed("Step 8: Delete paint entry", timings):
+            print(f"\n8. Deleting paint '{data.updated_name}'...")
+
+            search_and_delete(page, data.updated_name)
+
+        # ========================================
+        # STEP 9: Verify deletion
+        # ========================================
+        with timed("Step 9: Verify deletion", timings):
             print("\n9. Verifying paint deletion...")
             page.wait_for_timeout(500)
-            clear_search(page)
-            search_table(page, updated_paint_name)
-
-            verify_row_not_exists(page, updated_paint_name, "paint")
-
-            clear_search(page)
-            take_screenshot(page, "paints_09_after_deletion", "After deletion")
-
-            # ========================================
-            # TEST SUMMARY
-            # ========================================
-            print("\n" + "=" * 60)
-            print("=== TEST COMPLETED SUCCESSFULLY ===")
-            print("=" * 60)
-            print("\nTests performed:")
-            print("  [PASS] Navigate to Paints tab")
-            print("  [PASS] Validation (empty form)")
-            print("  [PASS] Create paint with all fields")
-            print("  [PASS] Verify creation in table")
-            print("  [PASS] Edit paint")
-            print("  [PASS] Search by name")
-            print("  [PASS] Search by manufacturer")
-            print("  [PASS] Data persistence after reload")
-            print("  [PASS] Delete paint")
-            print("  [PASS] Verify deletion")
-            print("\nScreenshots saved to /tmp/test_paints_*.png")
-
-            return True
-
-        except AssertionError as e:
-            print(f"\n[ASSERTION ERROR] {e}")
-            take_screenshot(page, "paints_error_assertion", "Assertion error")
-            import traceback
-
-            traceback.print_exc()
-            return False
-        except Exception as e:
-            print(f"\n[ERROR] {e}")
-            take_screenshot(page, "paints_error", "Error occurred")
-            import traceback
-
-            traceback.print_exc()
-            return False
-        finally:
-            context.close()
-            browser.close()
+            verify_row_deleted(page, data.updated_name, "paint")
+            take_step_screenshot(page, "paints_09_after_deletion", "After deletion")
+
+        # ========================================
+        # TEST SUMMARY
+        # ========================================
+        print("\n" + "=" * 60)
+        print("=== TEST COMPLETED SUCCESSFULLY ===")
+        print("=" * 60)
+        print("\nTests performed:")
+        print("  [PASS] Navigate to Paints tab")
+        print("  [PASS] Validation (empty form)")
+        print("  [PASS] Create paint with all fields")
+        print("  [PASS] Verify creation in table")
+        print("  [PASS] Edit paint")
+        print("  [PASS] Search by name")
+        print("  [PASS] Search by manufacturer")
+        print("  [PASS] Data persistence via API")
+        print("  [PASS] Delete paint")
+        print("  [PASS] Verify deletion")
+        if config["step_screenshots"]:
+            print_screenshot_location("paints")
+        print_timing_summary(timings)
+
+    except Exception:
+        take_screenshot(page, "paints_error", "Error occurred")
+        raise
+    finally:
+        page.close()
 
 
 if __name__ == "__main__":
-    success = test_paints_crud()
-    sys.exit(0 if success else 1)
+    buffer_stdout()
+    sys.exit(run_standalone(test_paints_crud, persistent=True))
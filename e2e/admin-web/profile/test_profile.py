@@ -5,69 +5,107 @@ Tests: Form validation, Update profile, Avatar upload/delete, Resume upload/dele
 """
 
 import sys
-import time
 from pathlib import Path
 from typing import Optional
 
-from playwright.sync_api import expect, sync_playwright
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+from playwright.sync_api import expect
 
-from e2e.auth.auth_manager import AuthManager
 from e2e.common.config import get_config
 from e2e.common.helpers import (
-    fill_text_input,
-    fill_textarea,
-    get_input_value,
+    fill_form,
+    get_input,
+    print_screenshot_location,
     take_screenshot,
-    wait_for_page_load,
+    take_step_screenshot,
+    unique_name,
 )
+from e2e.common.runner import run_standalone
 
 config = get_config()
 BASE_URL = config["admin_web_url"]
 
+# Selectors shared by the profile helpers below
+AVATAR_CARD = '.n-card:has-text("Avatar")'
+RESUME_CARD = '.n-card:has-text("Resume")'
+CROPPER_MODAL = '.n-modal[role="dialog"]:has-text("Crop Avatar")'
+SAVE_CHANGES_BUTTON = 'button.n-button--primary-type:has-text("Save Changes")'
+RESET_BUTTON = 'button:has-text("Reset")'
+FILE_INPUT = 'input[type="file"]'
+VIEW_RESUME_LINK = 'a:has-text("View Resume")'
+AVATAR_IMAGE = ".n-avatar"
+
 
 # ========================================
 # PROFILE-SPECIFIC HELPERS
 # ========================================
 
 
-def click_save_button(page, wait_ms: int = 1000):
-    """Click the Save Changes button on Profile page"""
-    save_btn = page.locator('button.n-button--primary-type:has-text("Save Changes")').first
-    save_btn.click()
-    page.wait_for_timeout(wait_ms)
+def wait_for_profile_form(page):
+    """Wait until the profile form is rendered and populated from the API
+
+    The saved profile always has a Full Name, so a non-empty value means the
+    profile request has completed and the form is ready to read.
+    """
+    expect(get_input(page, "Full Name")).not_to_have_value("")
+
+
+def click_save_button(page, expect_save: bool = True):
+    """Click the Save Changes button on Profile page
+
+    Args:
+        page: Playwright page object
+        expect_save: Wait for the profile update request to complete; pass
+            False when client-side validation is expected to block the save
+    """
+    save_btn = page.locator(SAVE_CHANGES_BUTTON).first
+    if not expect_save:
+        save_btn.click()
+        return
+
+    with page.expect_response(
+        lambda r: "/profile" in r.url
+        and r.request.resource_type in ("fetch", "xhr")
+        and r.request.method in ("PUT", "PATCH", "POST")
+    ):
+        save_btn.click()
+
 
+def click_reset_button(page, wait_ms: int = 0):
+    """Click the Reset button on Profile page
 
-def click_reset_button(page, wait_ms: int = 500):
-    """Click the Reset button on Profile page"""
-    reset_btn = page.locator('button:has-text("Reset")').first
+    Args:
+        page: Playwright page object
+        wait_ms: Optional extra wait in milliseconds (callers assert the reset values)
+    """
+    reset_btn = page.locator(RESET_BUTTON).first
     reset_btn.click()
-    page.wait_for_timeout(wait_ms)
+    if wait_ms:
+        page.wait_for_timeout(wait_ms)
 
 
-def upload_avatar_image(page, file_path: str, wait_ms: int = 1500):
+def upload_avatar_image(page, file_path: str):
     """Upload an avatar image (triggers cropper modal)
 
     Args:
         page: Playwright page object
         file_path: Path to image file
-        wait_ms: Wait time in milliseconds
     """
     # Locate the avatar upload input within the Avatar card
-    avatar_card = page.locator('.n-card:has-text("Avatar")').first
-    file_input = avatar_card.locator('input[type="file"]').first
+    avatar_card = page.locator(AVATAR_CARD).first
+    file_input = avatar_card.locator(FILE_INPUT).first
     file_input.set_input_files(file_path)
-    page.wait_for_timeout(wait_ms)
+    expect(page.locator(CROPPER_MODAL).first).to_be_visible()
 
 
-def confirm_avatar_crop(page, wait_ms: int = 2000):
-    """Confirm avatar crop in the ImageCropperModal
+def confirm_avatar_crop(page):
+    """Confirm avatar crop in the ImageCropperModal and wait for the upload
 
     Args:
         page: Playwright page object
-        wait_ms: Wait time after upload completes
     """
     # Locate the cropper modal
-    cropper_modal = page.locator('.n-modal[role="dialog"]:has-text("Crop Avatar")').first
+    cropper_modal = page.locator(CROPPER_MODAL).first
 
     # Wait for modal to be visible
     expect(cropper_modal).to_be_visible(timeout=5000)
@@ -76,53 +114,65 @@ def confirm_avatar_crop(page, wait_ms: int = 2000):
     upload_btn = cropper_modal.locator('button:has-text("Upload Avatar")').first
     upload_btn.click()
 
-    # Wait for upload to complete and modal to close
-    page.wait_for_timeout(wait_ms)
+    # The modal closes once the upload has completed
+    expect(cropper_modal).to_be_hidden()
 
 
-def cancel_avatar_crop(page, wait_ms: int = 500):
+def cancel_avatar_crop(page):
     """Cancel avatar crop in the ImageCropperModal"""
-    cropper_modal = page.locator('.n-modal[role="dialog"]:has-text("Crop Avatar")').first
+    cropper_modal = page.locator(CROPPER_MODAL).first
     cancel_btn = cropper_modal.locator('button:has-text("Cancel")').first
     cancel_btn.click()
-    page.wait_for_timeout(wait_ms)
+    expect(cropper_modal).to_be_hidden()
 
 
-def delete_avatar(page, wait_ms: int = 1000):
-    """Delete the current avatar"""
-    avatar_card = page.locator('.n-card:has-text("Avatar")').first
+def delete_avatar(page):
+    """Delete the current avatar and wait for it to leave the Avatar card"""
+    avatar_card = page.locator(AVATAR_CARD).first
     remove_btn = avatar_card.locator('button:has-text("Remove Avatar")').first
     remove_btn.click()
-    page.wait_for_timeout(wait_ms)
+    expect(avatar_card.locator(AVATAR_IMAGE)).to_have_count(0)
 
 
-def verify_avatar_exists(page):
-    """Verify that an avatar is displayed"""
-    avatar_card = page.locator('.n-card:has-text("Avatar")').first
-    avatar = avatar_card.locator(".n-avatar").first
-    return avatar.count() > 0
+def verify_avatar_exists(page, timeout: int = 5000):
+    """Verify that an avatar is displayed
+
+    Args:
+        page: Playwright page object
+        timeout: Timeout in milliseconds to wait for the avatar to appear
+
+    Returns:
+        bool: True if the avatar appears within the timeout
+    """
+    avatar_card = page.locator(AVATAR_CARD).first
+    avatar = avatar_card.locator(AVATAR_IMAGE).first
+    try:
+        avatar.wait_for(state="visible", timeout=timeout)
+        return True
+    except PlaywrightTimeoutError:
+        return False
 
 
-def upload_resume(page, file_path: str, wait_ms: int = 2000):
+def upload_resume(page, file_path: str):
     """Upload a resume file
 
+    Callers check the result with verify_resume_exists(), which waits for the
+    View Resume link.
+
     Args:
         page: Playwright page object
         file_path: Path to resume file (PDF, DOC, DOCX)
-        wait_ms: Wait time for upload to complete
     """
-    resume_card = page.locator('.n-card:has-text("Resume")').first
-    file_input = resume_card.locator('input[type="file"]').first
+    resume_card = page.locator(RESUME_CARD).first
+    file_input = resume_card.locator(FILE_INPUT).first
     file_input.set_input_files(file_path)
-    page.wait_for_timeout(wait_ms)
 
 
-def delete_resume(page, wait_ms: int = 1000):
-    """Delete the current resume"""
-    resume_card = page.locator('.n-card:has-text("Resume")').first
+def delete_resume(page):
+    """Delete the current resume (callers wait for the View Resume link to go)"""
+    resume_card = page.locator(RESUME_CARD).first
     remove_btn = resume_card.locator('button:has-text("Remove")').first
     remove_btn.click()
-    page.wait_for_timeout(wait_ms)
 
 
 def verify_resume_exists(page, file_name: Optional[str] = None, timeout: int = 5000):
@@ -136,24 +186,18 @@ def verify_resume_exists(page, file_name: Optional[str] = None, timeout: int = 5
     Returns:
         bool: True if resume exists (and matches file name if provided)
     """
-    resume_card = page.locator('.n-card:has-text("Resume")').first
-
-    # Check multiple indicators that resume exists
-    # 1. Check for the document icon
-    document_icon = resume_card.locator(".n-icon").first
-    if document_icon.count() == 0:
-        return False
+    resume_card = page.locator(RESUME_CARD).first
 
-    # 2. Check for View Resume link/button (it's an anchor tag styled as button)
-    view_link = resume_card.locator('a:has-text("View Resume")').first
+    # The View Resume link (an anchor styled as a button) appears once the upload is stored
+    view_link = resume_card.locator(VIEW_RESUME_LINK).first
     try:
         view_link.wait_for(state="visible", timeout=timeout)
         if file_name:
             # Also verify file name if provided
             file_text = resume_card.locator(f'text="{file_name}"').first
-            return file_text.count() > 0
+            file_text.wait_for(state="visible", timeout=timeout)
         return True
-    except Exception:
+    except PlaywrightTimeoutError:
         return False
 
 
@@ -162,290 +206,276 @@ def verify_resume_exists(page, file_name: Optional[str] = None, timeout: int = 5
 # ========================================
 
 
-def test_profile():
+def test_profile(authed_context):
     """Test Profile page operations"""
-    with sync_playwright() as p:
-        auth_manager = AuthManager()
-        browser = p.chromium.launch(headless=config["headless"])
-        page, context = auth_manager.authenticate(browser, strategy="auto")
-
-        if not page:
-            print("[ERROR] Authentication failed")
-            return False
-
-        print("\n=== PROFILE E2E TEST ===\n")
-
-        # Test data
-        test_name = f"E2E Test User {int(time.time())}"
-        test_title = "E2E Test Engineer"
-        test_tagline = "Testing the profile page with automated E2E tests"
-        test_email = "e2e.test@example.com"
-        test_phone = "+1 (555) 123-4567"
-        test_location = "Test City, Test Country"
-
-        updated_name = f"{test_name} Updated"
-        updated_title = "Senior E2E Test Engineer"
-
-        # File paths for testing - relative to e2e-tests root
-        test_files_dir = Path(__file__).parent.parent.parent.parent / "test-files"
-        avatar_file = test_files_dir / "test-avatar.jpg"
-        resume_file = test_files_dir / "test-resume.pdf"
-
-        try:
-            # ========================================
-            # STEP 1: Navigate to Profile page
-            # ========================================
-            print("1. Navigating to Profile page...")
-            page.goto(f"{BASE_URL}/profile")
-            wait_for_page_load(page)
-            take_screenshot(page, "profile_01_page_loaded", "Profile page loaded")
-            print("   [OK] Profile page loaded")
-
-            # ========================================
-            # STEP 2: Capture original data
-            # ========================================
-            print("\n2. Capturing original profile data...")
-            original_name = get_input_value(page, "Full Name")
-            original_title = get_input_value(page, "Professional Title")
-            print(f"   [INFO] Original name: {original_name}")
-            print(f"   [INFO] Original title: {original_title}")
-
-            # ========================================
-            # STEP 3: Test validation - empty required field
-            # ========================================
-            print("\n3. Testing validation - clearing required field...")
-            fill_text_input(page, label="Full Name", value="")
-            click_save_button(page)
-
-            # Check if validation error appears (form should not save)
-            page.wait_for_timeout(500)
-            current_name = get_input_value(page, "Full Name")
-            if current_name == "":
-                print("   [OK] Validation prevents empty name field")
-                take_screenshot(page, "profile_02_validation_error", "Validation error")
-
-            # Restore name
-            fill_text_input(page, label="Full Name", value=original_name or test_name)
-
-            # ========================================
-            # STEP 4: Update profile information
-            # ========================================
-            print("\n4. Updating profile information...")
-            fill_text_input(page, label="Full Name", value=test_name)
-            fill_text_input(page, label="Professional Title", value=test_title)
-            fill_textarea(page, label="Bio / Tagline", value=test_tagline)
-            fill_text_input(page, label="Email", value=test_email)
-            fill_text_input(page, label="Phone", value=test_phone)
-            fill_text_input(page, label="Location", value=test_location)
-
-            take_screenshot(page, "profile_03_form_filled", "Profile form filled")
-            print("   [OK] Profile form filled")
-
-            # Save changes
-            click_save_button(page)
-            page.wait_for_timeout(1000)
-            print("   [OK] Profile saved successfully")
-
-            # ========================================
-            # STEP 5: Verify updated data persists
-            # ========================================
-            print("\n5. Verifying updated data...")
-            saved_name = get_input_value(page, "Full Name")
-            saved_title = get_input_value(page, "Professional Title")
-            saved_email = get_input_value(page, "Email")
-
-            assert saved_name == test_name, f"Name mismatch: {saved_name} != {test_name}"
-            assert saved_title == test_title, f"Title mismatch: {saved_title} != {test_title}"
-            assert saved_email == test_email, f"Email mismatch: {saved_email} != {test_email}"
-            print(f"   [OK] Profile data verified: {test_name}")
-
-            # ========================================
-            # STEP 6: Test Reset functionality
-            # ========================================
-            print("\n6. Testing Reset functionality...")
-            fill_text_input(page, label="Full Name", value="Temporary Change")
-            click_reset_button(page)
-            page.wait_for_timeout(500)
-
-            reset_name = get_input_value(page, "Full Name")
-            assert reset_name == test_name, "Reset should restore saved data"
-            print("   [OK] Reset restored saved data")
-
-            # ========================================
-            # STEP 7: Test avatar upload (if test file exists)
-            # ========================================
-            if avatar_file.exists():
-                print("\n7. Testing avatar upload...")
-                print(f"   [INFO] Using test file: {avatar_file}")
-
-                # Upload avatar
-                upload_avatar_image(page, str(avatar_file))
-                take_screenshot(page, "profile_04_cropper_modal", "Avatar cropper modal")
-
-                # Confirm crop
-                confirm_avatar_crop(page)
-                print("   [OK] Avatar uploaded and cropped")
-
-                # Verify avatar exists
-                page.wait_for_timeout(1000)
-                assert verify_avatar_exists(page), "Avatar should be visible after upload"
-                print("   [OK] Avatar verified in UI")
-                take_screenshot(page, "profile_05_avatar_uploaded", "Avatar uploaded")
-            else:
-                print(f"\n7. [SKIP] Avatar test - file not found: {avatar_file}")
-
-            # ========================================
-            # STEP 8: Test resume upload (if test file exists)
-            # ========================================
-            if resume_file.exists():
-                print("\n8. Testing resume upload...")
-                print(f"   [INFO] Using test file: {resume_file}")
-
-                # Upload resume
-                upload_resume(page, str(resume_file))
-                print("   [OK] Resume uploaded")
-
-                # Verify resume exists
-                page.wait_for_timeout(1000)
-                assert verify_resume_exists(page), "Resume should be visible after upload"
-                print("   [OK] Resume verified in UI")
-                take_screenshot(page, "profile_06_resume_uploaded", "Resume uploaded")
-            else:
-                print(f"\n8. [SKIP] Resume test - file not found: {resume_file}")
-
-            # ========================================
-            # STEP 9: Test data persistence - reload page
-            # ========================================
-            print("\n9. Testing data persistence - reloading page...")
-            page.reload()
-            wait_for_page_load(page)
-            page.wait_for_timeout(500)
-
-            persisted_name = get_input_value(page, "Full Name")
-            persisted_title = get_input_value(page, "Professional Title")
-
-            assert persisted_name == test_name, "Name should persist after reload"
-            assert persisted_title == test_title, "Title should persist after reload"
-            print("   [OK] Profile data persisted after reload")
-
-            # Verify avatar persists (if uploaded)
-            if avatar_file.exists() and verify_avatar_exists(page):
-                print("   [OK] Avatar persisted after reload")
-
-            # Verify resume persists (if uploaded)
-            if resume_file.exists() and verify_resume_exists(page):
-                print("   [OK] Resume persisted after reload")
-
-            take_screenshot(page, "profile_07_after_reload", "After reload")
-
-            # ========================================
-            # STEP 10: Test avatar deletion (if avatar exists)
-            # ========================================
-            if avatar_file.exists() and verify_avatar_exists(page):
-                print("\n10. Testing avatar deletion...")
-                delete_avatar(page)
-                page.wait_for_timeout(1000)
-
-                assert not verify_avatar_exists(page), "Avatar should be removed"
-                print("   [OK] Avatar deleted successfully")
-                take_screenshot(page, "profile_08_avatar_deleted", "Avatar deleted")
-            else:
-                print("\n10. [SKIP] Avatar deletion test - no avatar to delete")
-
-            # ========================================
-            # STEP 11: Test resume deletion (if resume exists)
-            # ========================================
-            if resume_file.exists() and verify_resume_exists(page):
-                print("\n11. Testing resume deletion...")
-                delete_resume(page)
-                page.wait_for_timeout(1000)
-
-                assert not verify_resume_exists(page), "Resume should be removed"
-                print("   [OK] Resume deleted successfully")
-                take_screenshot(page, "profile_09_resume_deleted", "Resume deleted")
-            else:
-                print("\n11. [SKIP] Resume deletion test - no resume to delete")
-
-            # ========================================
-            # STEP 12: Update profile again
-            # ========================================
-            print("\n12. Updating profile with new data...")
-            fill_text_input(page, label="Full Name", value=updated_name)
-            fill_text_input(page, label="Professional Title", value=updated_title)
-
-            click_save_button(page)
-            page.wait_for_timeout(1000)
-
-            final_name = get_input_value(page, "Full Name")
-            final_title = get_input_value(page, "Professional Title")
-
-            assert final_name == updated_name, "Updated name should be saved"
-            assert final_title == updated_title, "Updated title should be saved"
-            print(f"   [OK] Profile updated to: {updated_name}")
-            take_screenshot(page, "profile_10_final_update", "Final update")
-
-            # ========================================
-            # STEP 13: Restore original data (cleanup)
-            # ========================================
-            print("\n13. Restoring original profile data...")
-            fill_text_input(page, label="Full Name", value=original_name or "")
-            fill_text_input(page, label="Professional Title", value=original_title or "")
-            click_save_button(page)
-            page.wait_for_timeout(1000)
-            print("   [OK] Original data restored")
-
-            # ========================================
-            # TEST SUMMARY
-            # ========================================
-            print("\n" + "=" * 60)
-            print("=== TEST COMPLETED SUCCESSFULLY ===")
-            print("=" * 60)
-            print("\nTests performed:")
-            print("  [PASS] Navigate to Profile page")
-            print("  [PASS] Capture original data")
-            print("  [PASS] Validation (required field)")
-            print("  [PASS] Update profile information")
-            print("  [PASS] Verify updated data")
-            print("  [PASS] Test Reset functionality")
-
-            if avatar_file.exists():
-                print("  [PASS] Avatar upload with cropping")
-                print("  [PASS] Avatar deletion")
-            else:
-                print("  [SKIP] Avatar tests (test file not found)")
-
-            if resume_file.exists():
-                print("  [PASS] Resume upload")
-                print("  [PASS] Resume deletion")
-            else:
-                print("  [SKIP] Resume tests (test file not found)")
-
-            print("  [PASS] Data persistence after reload")
-            print("  [PASS] Update profile again")
-            print("  [PASS] Restore original data")
-            print("\nScreenshots saved to /tmp/test_profile_*.png")
-
-            return True
-
-        except AssertionError as e:
-            print(f"\n[ASSERTION ERROR] {e}")
-            take_screenshot(page, "profile_error_assertion", "Assertion error")
-            import traceback
-
-            traceback.print_exc()
-            return False
-        except Exception as e:
-            print(f"\n[ERROR] {e}")
-            take_screenshot(page, "profile_error", "Error occurred")
-            import traceback
-
-            traceback.print_exc()
-            return False
-        finally:
-            context.close()
-            browser.close()
+    page = authed_context.new_page()
+
+    name_input = get_input(page, "Full Name")
+    title_input = get_input(page, "Professional Title")
+    email_input = get_input(page, "Email")
+
+    print("\n=== PROFILE E2E TEST ===\n")
+
+    # Test data
+    test_name = unique_name("E2E Test User")
+    test_title = "E2E Test Engineer"
+    test_tagline = "Testing the profile page with automated E2E tests"
+    test_email = "e2e.test@example.com"
+    test_phone = "+1 (555) 123-4567"
+    test_location = "Test City, Test Country"
+
+    updated_name = f"{test_name} Updated"
+    updated_title = "Senior E2E Test Engineer"
+
+    # File paths for testing - relative to e2e-tests root
+    test_files_dir = Path(__file__).parent.parent.parent.parent / "test-files"
+    avatar_file = test_files_dir / "test-avatar.jpg"
+    resume_file = test_files_dir / "test-resume.pdf"
+
+    try:
+        # ========================================
+        # STEP 1: Navigate to Profile page
+        # ========================================
+        print("1. Navigating to Profile page...")
+        page.goto(f"{BASE_URL}/profile", wait_until="domcontentloaded")
+        wait_for_profile_form(page)
+        take_step_screenshot(page, "profile_01_page_loaded", "Profile page loaded")
+        print("   [OK] Profile page loaded")
+
+        # ========================================
+        # STEP 2: Capture original data
+        # ========================================
+        print("\n2. Capturing original profile data...")
+        original_name = name_input.input_value()
+        original_title = title_input.input_value()
+        print(f"   [INFO] Original name: {original_name}")
+        print(f"   [INFO] Original title: {original_title}")
+
+        # ========================================
+        # STEP 3: Test validation - empty required field
+        # ========================================
+        print("\n3. Testing validation - clearing required field...")
+        name_input.fill("")
+        click_save_button(page, expect_save=False)
+
+        # Check if validation error appears (form should not save)
+        expect(page.locator(".n-form-item-feedback--error").first).to_be_visible()
+        current_name = name_input.input_value()
+        if current_name == "":
+            print("   [OK] Validation prevents empty name field")
+            take_step_screenshot(page, "profile_02_validation_error", "Validation error")
+
+        # Restore name
+        name_input.fill(original_name or test_name)
+
+        # ========================================
+        # STEP 4: Update profile information
+        # ========================================
+        print("\n4. Updating profile information...")
+        fill_form(
+            page,
+            {
+                "Full Name": test_name,
+                "Professional Title": test_title,
+                "Bio / Tagline": test_tagline,
+                "Email": test_email,
+                "Phone": test_phone,
+                "Location": test_location,
+            },
+        )
+
+        take_step_screenshot(page, "profile_03_form_filled", "Profile form filled")
+        print("   [OK] Profile form filled")
+
+        # Save changes
+        click_save_button(page)
+        print("   [OK] Profile saved successfully")
+
+        # ========================================
+        # STEP 5: Verify updated data persists
+        # ========================================
+        print("\n5. Verifying updated data...")
+        saved_name = name_input.input_value()
+        saved_title = title_input.input_value()
+        saved_email = email_input.input_value()
+
+        assert saved_name == test_name, f"Name mismatch: {saved_name} != {test_name}"
+        assert saved_title == test_title, f"Title mismatch: {saved_title} != {test_title}"
+        assert saved_email == test_email, f"Email mismatch: {saved_email} != {test_email}"
+        print(f"   [OK] Profile data verified: {test_name}")
+
+        # ========================================
+        # STEP 6: Test Reset functionality
+        # ========================================
+        print("\n6. Testing Reset functionality...")
+        name_input.fill("Temporary Change")
+        click_reset_button(page)
+        expect(name_input).to_have_value(test_name)
+
+        reset_name = name_input.input_value()
+        assert reset_name == test_name, "Reset should restore saved data"
+        print("   [OK] Reset restored saved data")
+
+        # ========================================
+        # STEP 7: Test avatar upload (if test file exists)
+        # ========================================
+        if avatar_file.exists():
+            print("\n7. Testing avatar upload...")
+            print(f"   [INFO] Using test file: {avatar_file}")
+
+            # Upload avatar
+            upload_avatar_image(page, str(avatar_file))
+            take_step_screenshot(page, "profile_04_cropper_modal", "Avatar cropper modal")
+
+            # Confirm crop
+            confirm_avatar_crop(page)
+            print("   [OK] Avatar uploaded and cropped")
+
+            # Verify avatar exists
+            assert verify_avatar_exists(page), "Avatar should be visible after upload"
+            print("   [OK] Avatar verified in UI")
+            take_step_screenshot(page, "profile_05_avatar_uploaded", "Avatar uploaded")
+        else:
+            print(f"\n7. [SKIP] Avatar test - file not found: {avatar_file}")
+
+        # ========================================
+        # STEP 8: Test resume upload (if test file exists)
+        # ========================================
+        if resume_file.exists():
+            print("\n8. Testing resume upload...")
+            print(f"   [INFO] Using test file: {resume_file}")
+
+            # Upload resume
+            upload_resume(page, str(resume_file))
+            print("   [OK] Resume uploaded")
+
+            # Verify resume exists
+            assert verify_resume_exists(page), "Resume should be visible after upload"
+            print("   [OK] Resume verified in UI")
+            take_step_screenshot(page, "profile_06_resume_uploaded", "Resume uploaded")
+        else:
+            print(f"\n8. [SKIP] Resume test - file not found: {resume_file}")
+
+        # ========================================
+        # STEP 9: Test data persistence - reload page
+        # ========================================
+        print("\n9. Testing data persistence - reloading page...")
+        page.reload(wait_until="domcontentloaded")
+        wait_for_profile_form(page)
+
+        persisted_name = name_input.input_value()
+        persisted_title = title_input.input_value()
+
+        assert persisted_name == test_name, "Name should persist after reload"
+        assert persisted_title == test_title, "Title should persist after reload"
+        print("   [OK] Profile data persisted after reload")
+
+        # Probe the uploads once; the deletion steps below reuse the results
+        avatar_persisted = avatar_file.exists() and verify_avatar_exists(page)
+        resume_persisted = resume_file.exists() and verify_resume_exists(page)
+
+        # Verify avatar persists (if uploaded)
+        if avatar_persisted:
+            print("   [OK] Avatar persisted after reload")
+
+        # Verify resume persists (if uploaded)
+        if resume_persisted:
+            print("   [OK] Resume persisted after reload")
+
+        take_step_screenshot(page, "profile_07_after_reload", "After reload")
+
+        # ========================================
+        # STEP 10: Test avatar deletion (if avatar exists)
+        # ========================================
+        if avatar_persisted:
+            print("\n10. Testing avatar deletion...")
+            # delete_avatar() waits for the avatar to leave the card
+            delete_avatar(page)
+            print("   [OK] Avatar deleted successfully")
+            take_step_screenshot(page, "profile_08_avatar_deleted", "Avatar deleted")
+        else:
+            print("\n10. [SKIP] Avatar deletion test - no avatar to delete")
+
+        # ========================================
+        # STEP 11: Test resume deletion (if resume exists)
+        # ========================================
+        if resume_persisted:
+            print("\n11. Testing resume deletion...")
+            delete_resume(page)
+
+            # Wait for the link to go away instead of letting verify_resume_exists()
+            # wait out its full visibility timeout
+            view_link = page.locator(RESUME_CARD).first.locator(VIEW_RESUME_LINK)
+            expect(view_link).to_be_hidden()
+            print("   [OK] Resume deleted successfully")
+            take_step_screenshot(page, "profile_09_resume_deleted", "Resume deleted")
+        else:
+            print("\n11. [SKIP] Resume deletion test - no resume to delete")
+
+        # ========================================
+        # STEP 12: Update profile again
+        # ========================================
+        print("\n12. Updating profile with new data...")
+        fill_form(page, {"Full Name": updated_name, "Professional Title": updated_title})
+
+        click_save_button(page)
+
+        final_name = name_input.input_value()
+        final_title = title_input.input_value()
+
+        assert final_name == updated_name, "Updated name should be saved"
+        assert final_title == updated_title, "Updated title should be saved"
+        print(f"   [OK] Profile updated to: {updated_name}")
+        take_step_screenshot(page, "profile_10_final_update", "Final update")
+
+        # ========================================
+        # STEP 13: Restore original data (cleanup)
+        # ========================================
+        print("\n13. Restoring original profile data...")
+        fill_form(
+            page, {"Full Name": original_name or "", "Professional Title": original_title or ""}
+        )
+        click_save_button(page)
+        print("   [OK] Original data restored")
+
+        # ========================================
+        # TEST SUMMARY
+        # ========================================
+        print("\n" + "=" * 60)
+        print("=== TEST COMPLETED SUCCESSFULLY ===")
+        print("=" * 60)
+        print("\nTests performed:")
+        print("  [PASS] Navigate to Profile page")
+        print("  [PASS] Capture original data")
+        print("  [PASS] Validation (required field)")
+        print("  [PASS] Update profile information")
+        print("  [PASS] Verify updated data")
+        print("  [PASS] Test Reset functionality")
+
+        if avatar_file.exists():
+            print("  [PASS] Avatar upload with cropping")
+            print("  [PASS] Avatar deletion")
+        else:
+            print("  [SKIP] Avatar tests (test file not found)")
+
+        if resume_file.exists():
+            print("  [PASS] Resume upload")
+            print("  [PASS] Resume deletion")
+        else:
+            print("  [SKIP] Resume tests (test file not found)")
+
+        print("  [PASS] Data persistence after reload")
+        print("  [PASS] Update profile again")
+        print("  [PASS] Restore original data")
+        if config["step_screenshots"]:
+            print_screenshot_location("profile")
+
+    except Exception:
+        take_screenshot(page, "profile_error", "Error occurred")
+        raise
+    finally:
+        page.close()
 
 
 if __name__ == "__main__":
-    success = test_profile()
-    sys.exit(0 if success else 1)
+    sys.exit(run_standalone(test_profile))
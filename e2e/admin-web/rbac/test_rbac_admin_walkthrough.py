@@ -10,6 +10,7 @@ import traceback
 from playwright.sync_api import expect, sync_playwright
 
 from e2e.auth.auth_manager import AuthManager
+from e2e.common.browser import launch_browser
 from e2e.common.config import get_config
 from e2e.common.helpers import (
     delete_row,
@@ -17,15 +18,19 @@ from e2e.common.helpers import (
     expand_sidebar,
     fill_text_input,
     find_dashboard_card,
+    find_table_row,
     navigate_to_page,
     navigate_to_tab,
     open_add_modal,
     open_edit_modal,
+    print_screenshot_location,
     save_modal,
     search_and_verify,
     search_table,
+    switch_tab,
     take_screenshot,
     verify_row_not_exists,
+    worker_suffix,
 )
 
 config = get_config()
@@ -57,7 +62,7 @@ def verify_add_button_visible(page, button_text):
 
 def verify_edit_button_in_row(page, row_identifier):
     """Verify Edit button exists in a table row"""
-    row = page.locator(f'.n-data-table tbody tr:has-text("{row_identifier}")').first
+    row = find_table_row(page, row_identifier).first
     edit_btn = row.locator('button[aria-label*="Edit" i]').first
     expect(edit_btn).to_be_visible(timeout=3000)
     return edit_btn
@@ -65,7 +70,7 @@ def verify_edit_button_in_row(page, row_identifier):
 
 def verify_delete_button_in_row(page, row_identifier):
     """Verify Delete button exists in a table row"""
-    row = page.locator(f'.n-data-table tbody tr:has-text("{row_identifier}")').first
+    row = find_table_row(page, row_identifier).first
     delete_btn = row.locator('button[aria-label*="Delete" i]').first
     expect(delete_btn).to_be_visible(timeout=3000)
     return delete_btn
@@ -75,13 +80,13 @@ def test_rbac_admin_walkthrough():
     """Test Admin user has full access to all features"""
     with sync_playwright() as p:
         auth_manager = AuthManager()
-        browser = p.chromium.launch(headless=config["headless"])
+        browser = launch_browser(p)
         page, context = auth_manager.authenticate(browser, strategy="auto")
 
         print("\n=== RBAC ADMIN WALKTHROUGH E2E TEST ===\n")
 
         # Test data with unique timestamp
-        timestamp = int(time.time())
+        timestamp = f"{int(time.time())}{worker_suffix()}"
         test_skill_type = f"E2E Admin Type {timestamp}"
 
         try:
@@ -257,11 +262,12 @@ def test_rbac_admin_walkthrough():
             verify_add_button_visible(page, "Add Theme")
             print("   [OK] Add Theme button visible")
 
-            navigate_to_tab(page, BASE_URL, "miniatures", "Projects")
+            # Same page - switch tabs and let the button assertion do the waiting
+            switch_tab(page, "Projects", wait_ms=0)
             verify_add_button_visible(page, "Add Project")
             print("   [OK] Add Miniature Project button visible")
 
-            navigate_to_tab(page, BASE_URL, "miniatures", "Paints")
+            switch_tab(page, "Paints", wait_ms=0)
             verify_add_button_visible(page, "Add Paint")
             print("   [OK] Add Paint button visible")
 
@@ -320,7 +326,7 @@ def test_rbac_admin_walkthrough():
             print("  [PASS] Miniatures - All tabs with Add buttons")
             print("  [PASS] Messaging - Recipients Add + Messages tab accessible")
             print("  [PASS] Profile - Editable fields + file uploads")
-            print("\nScreenshots saved to /tmp/test_rbac_admin_*.png")
+            print_screenshot_location("rbac_admin")
 
             return True
 
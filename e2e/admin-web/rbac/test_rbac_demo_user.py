@@ -10,12 +10,14 @@ import traceback
 from playwright.sync_api import expect, sync_playwright
 
 from e2e.auth.auth_manager import AuthManager
+from e2e.common.browser import launch_browser
 from e2e.common.config import get_config
 from e2e.common.helpers import (
     expand_sidebar,
     find_dashboard_card,
     navigate_to_page,
     navigate_to_tab,
+    print_screenshot_location,
     take_screenshot,
 )
 
@@ -58,7 +60,7 @@ def verify_dashboard_card_hidden(page, card_title):
 def test_rbac_demo_user():
     """Test Demo user has read-only access with proper restrictions"""
     with sync_playwright() as p:
-        browser = p.chromium.launch(headless=config["headless"])
+        browser = launch_browser(p)
 
         # Use AuthManager with demo user credentials from config
         auth_manager = AuthManager(
@@ -272,7 +274,7 @@ def test_rbac_demo_user():
             print("  [PASS] Miniatures - No Add buttons on all tabs")
             print("  [PASS] Profile - Fields disabled, no file upload, no Save button")
             print("  [PASS] Direct URL to Messaging blocked")
-            print("\nScreenshots saved to /tmp/test_rbac_demo_*.png")
+            print_screenshot_location("rbac_demo")
 
             return True
 
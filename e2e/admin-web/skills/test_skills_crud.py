@@ -10,6 +10,7 @@ import time
 from playwright.sync_api import sync_playwright
 
 from e2e.auth.auth_manager import AuthManager
+from e2e.common.browser import launch_browser
 from e2e.common.config import get_config
 from e2e.common.helpers import (
     clear_search,
@@ -23,6 +24,7 @@ from e2e.common.helpers import (
     navigate_to_tab,
     open_add_modal,
     open_edit_modal,
+    print_screenshot_location,
     save_modal,
     search_and_verify,
     search_table,
@@ -31,6 +33,7 @@ from e2e.common.helpers import (
     verify_cell_contains,
     verify_row_not_exists,
     wait_for_page_load,
+    worker_suffix,
 )
 
 config = get_config()
@@ -41,7 +44,7 @@ def test_skills_crud():
     """Test Skills page CRUD operations for both Skill Types and Skills"""
     with sync_playwright() as p:
         auth_manager = AuthManager()
-        browser = p.chromium.launch(headless=config["headless"])
+        browser = launch_browser(p)
         page, context = auth_manager.authenticate(browser, strategy="auto")
 
         if not page:
@@ -51,12 +54,12 @@ def test_skills_crud():
         print("\n=== SKILLS E2E TEST ===\n")
 
         # Test data
-        test_type_name = f"E2E Test Type {int(time.time())}"
+        test_type_name = f"E2E Test Type {int(time.time())}{worker_suffix()}"
         test_type_desc = "Automated E2E testing skill category"
         updated_type_name = f"{test_type_name} Updated"
         updated_type_desc = "Updated E2E testing category"
 
-        test_skill_name = f"E2E Test Skill {int(time.time())}"
+        test_skill_name = f"E2E Test Skill {int(time.time())}{worker_suffix()}"
         updated_skill_name = f"{test_skill_name} Updated"
 
         try:
@@ -437,7 +440,7 @@ def test_skills_crud():
             print("  [PASS] Verify deletion")
             print("\n  OVERALL:")
             print("  [PASS] Verify deletions persist after reload")
-            print("\nScreenshots saved to /tmp/test_skills_*.png")
+            print_screenshot_location("skills")
 
             return True
 
@@ -7,10 +7,14 @@ Supports multiple authentication strategies:
 3. Manual login prompt (only in interactive mode)
 """
 
+import re
 import sys
+import time
 from pathlib import Path
 
+from e2e.common.browser import CHROMIUM_ARGS
 from e2e.common.config import get_config
+from e2e.common.helpers import worker_suffix
 
 
 class AuthManager:
@@ -27,11 +31,17 @@ class AuthManager:
         """
         self.config = get_config()
         self.base_url = base_url or self.config["admin_web_url"]
-        self.context_path = Path(__file__).parent / ".auth" / "context.json"
         self.credentials = {
             "username": username or self.config["admin_username"],
             "password": password or self.config["admin_password"],
         }
+        # The storage state is keyed by user, so a demo user session never replaces
+        # the admin one, and by pytest-xdist worker, so parallel workers never write
+        # the same file
+        user_key = re.sub(r"[^\w.-]", "_", self.credentials["username"] or "manual")
+        self.context_path = (
+            Path(__file__).parent / ".auth" / f"context_{user_key}{worker_suffix()}.json"
+        )
 
     def ensure_auth_directory(self):
         """Ensure .auth directory exists for storing context"""
@@ -43,6 +53,13 @@ class AuthManager:
         context.storage_state(path=str(self.context_path))
         print(f"   [OK] Saved auth context to {self.context_path}")
 
+    def saved_context_is_fresh(self):
+        """Check whether the saved context is younger than TEST_AUTH_STATE_MAX_AGE"""
+        if not self.context_path.exists():
+            return False
+        age = time.time() - self.context_path.stat().st_mtime
+        return age < self.config["auth_state_max_age"]
+
     def load_context(self, browser):
         """Load saved browser context if available"""
         if self.context_path.exists():
@@ -140,10 +157,35 @@ class AuthManager:
         - 'context': Use saved context only
         - 'credentials': Use credentials only
         - 'manual': Manual login only
+        - 'reuse': Saved context if still valid, otherwise 'auto' (refreshes the saved file).
+          A context saved less than TEST_AUTH_STATE_MAX_AGE seconds ago is used without
+          checking it against the dashboard first.
         """
         print("\n[AUTH] Starting authentication...")
         print(f"[AUTH] Base URL: {self.base_url}")
 
+        if strategy == "reuse":
+            fresh = self.saved_context_is_fresh()
+            context = self.load_context(browser)
+            if context and fresh:
+                print("   [OK] Authenticated using recently saved context")
+                return context.new_page(), context
+            if context:
+                page = context.new_page()
+                page.goto(f"{self.base_url}/dashboard")
+                page.wait_for_load_state("networkidle")
+
+                if "login" not in page.url:
+                    print("   [OK] Authenticated using saved context")
+                    # Re-save so the checked state counts as fresh again
+                    self.save_context(context)
+                    return page, context
+
+                print("   [INFO] Saved context expired, logging in again...")
+                page.close()
+                context.close()
+            strategy = "auto"
+
         # For 'auto' strategy: prefer credentials over saved context to ensure validation
         # Only use saved context if credentials are not provided
         if strategy == "auto" and self.credentials["username"]:
@@ -211,6 +253,58 @@ class AuthManager:
             "Check credentials in .env or run tests interactively."
         )
 
+    def profile_dir(self, name):
+        """Return the persistent profile directory for a test and pytest-xdist worker
+
+        Chromium locks a profile directory while it is open, so concurrent runs
+        need separate directories.
+        """
+        return Path(__file__).parent / ".auth" / f"profile_{name}{worker_suffix()}"
+
+    def authenticate_persistent(self, playwright, profile_name="default"):
+        """
+        Authenticate using a persistent browser profile
+
+        The profile directory keeps cookies and the HTTP cache between runs,
+        so an existing session skips the UI login and Chromium starts warm.
+        Falls back to credentials when the stored session has expired.
+
+        Args:
+            playwright: Playwright instance from sync_playwright()
+            profile_name: Profile directory name, usually the test name
+
+        Raises RuntimeError if authentication fails
+        Returns: (page, context) tuple - closing the context closes the browser
+        """
+        print("\n[AUTH] Starting authentication (persistent profile)...")
+        print(f"[AUTH] Base URL: {self.base_url}")
+
+        self.ensure_auth_directory()
+        context = playwright.chromium.launch_persistent_context(
+            user_data_dir=str(self.profile_dir(profile_name)),
+            headless=self.config["headless"],
+            slow_mo=self.config["slow_mo"],
+            ignore_https_errors=self.config.get("ignore_https_errors", False),
+            args=CHROMIUM_ARGS,
+        )
+        page = context.pages[0] if context.pages else context.new_page()
+
+        page.goto(f"{self.base_url}/dashboard")
+        page.wait_for_load_state("networkidle")
+        if "login" not in page.url:
+            print("   [OK] Authenticated using persistent profile session")
+            return page, context
+
+        if self.credentials["username"] and self.login_with_credentials(page):
+            return page, context
+
+        print("   [FAIL] Persistent profile authentication failed")
+        context.close()
+        raise RuntimeError(
+            "Authentication failed: No valid session in persistent profile. "
+            "Check your configured username/password or .env values."
+        )
+
 
 def authenticate_for_testing(browser, base_url=None, strategy="auto"):
     """
@@ -0,0 +1,69 @@
+"""
+Browser launch helpers for E2E tests
+Shared by the pytest session fixtures, the standalone runner and AuthManager
+"""
+
+import re
+
+from playwright.sync_api import Browser, BrowserContext, Playwright
+
+from e2e.common.config import get_config
+
+# Chromium flags that avoid /dev/shm exhaustion in containers and skip GPU setup
+CHROMIUM_ARGS = ["--disable-dev-shm-usage", "--disable-gpu"]
+
+# Static assets the tests never assert on (matched by URL so other requests
+# are not routed through the Python side at all)
+STATIC_ASSET_PATTERN = re.compile(
+    r"\.(png|jpe?g|gif|webp|avif|ico|woff2?|ttf|otf|eot|mp4|webm|mp3)(\?.*)?$", re.IGNORECASE
+)
+
+# Third-party analytics and error reporting hosts
+TRACKER_PATTERN = re.compile(
+    r"^https?://([^/]+\.)?"
+    r"(google-analytics\.com|googletagmanager\.com|segment\.(com|io)|sentry\.io)/"
+)
+
+
+def launch_browser(playwright: Playwright) -> Browser:
+    """Launch Chromium using the configured headless mode
+
+    Args:
+        playwright: Playwright instance from sync_playwright()
+
+    Returns:
+        Browser: Launched browser
+    """
+    config = get_config()
+    return playwright.chromium.launch(
+        headless=config["headless"], slow_mo=config["slow_mo"], args=CHROMIUM_ARGS
+    )
+
+
+def block_static_assets(context: BrowserContext) -> None:
+    """Abort image, font, media and tracker requests when TEST_BLOCK_RESOURCES is enabled
+
+    Upload checks are unaffected: verify_file_uploaded() looks for the preview
+    elements, not for loaded image pixels.
+
+    Args:
+        context: Browser context to install the routes on
+    """
+    if get_config()["block_resources"]:
+        context.route(STATIC_ASSET_PATTERN, lambda route: route.abort())
+        context.route(TRACKER_PATTERN, lambda route: route.abort())
+
+
+def prepare_context(context: BrowserContext) -> None:
+    """Apply the configured defaults to a test browser context
+
+    Sets the TEST_TIMEOUT action and TEST_NAVIGATION_TIMEOUT navigation
+    timeouts and installs the static asset routes.
+
+    Args:
+        context: Browser context to configure
+    """
+    config = get_config()
+    context.set_default_timeout(config["timeout"])
+    context.set_default_navigation_timeout(config["navigation_timeout"])
+    block_static_assets(context)
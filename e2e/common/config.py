@@ -3,6 +3,7 @@ Configuration manager for E2E tests
 Loads settings from .env file and environment variables
 """
 
+import functools
 import os
 import re
 import tempfile
@@ -73,6 +74,7 @@ class TestConfig:
             # Authentication - Demo user (read-only)
             "demo_username": self._get_value("TEST_DEMO_USERNAME", "demo", env_vars),
             "demo_password": self._get_value("TEST_DEMO_PASSWORD", "demo123", env_vars),
+            "auth_state_max_age": int(self._get_value("TEST_AUTH_STATE_MAX_AGE", "3600", env_vars)),
             # URLs
             "admin_web_url": self._get_value("TEST_ADMIN_WEB_URL", "http://localhost:81", env_vars),
             "admin_api_url": self._get_value(
@@ -86,12 +88,18 @@ class TestConfig:
                 "TEST_PUBLIC_API_URL", "http://localhost:8082", env_vars
             ),
             # Test behavior
-            "headless": self._parse_bool(self._get_value("TEST_HEADLESS", "false", env_vars)),
+            "headless": self._parse_bool(self._get_value("TEST_HEADLESS", "true", env_vars)),
             "screenshot_dir": self._get_value(
                 "TEST_SCREENSHOT_DIR", tempfile.gettempdir(), env_vars
             ),
+            "step_screenshots": self._parse_bool(
+                self._get_value("TEST_STEP_SCREENSHOTS", "false", env_vars)
+            ),
             "slow_mo": int(self._get_value("TEST_SLOW_MO", "0", env_vars)),
-            "timeout": int(self._get_value("TEST_TIMEOUT", "30000", env_vars)),
+            "timeout": int(self._get_value("TEST_TIMEOUT", "7000", env_vars)),
+            "navigation_timeout": int(
+                self._get_value("TEST_NAVIGATION_TIMEOUT", "15000", env_vars)
+            ),
             # Browser options
             "browser": self._get_value(
                 "TEST_BROWSER", "chromium", env_vars
@@ -99,6 +107,9 @@ class TestConfig:
             "ignore_https_errors": self._parse_bool(
                 self._get_value("TEST_IGNORE_HTTPS_ERRORS", "false", env_vars)
             ),
+            "block_resources": self._parse_bool(
+                self._get_value("TEST_BLOCK_RESOURCES", "true", env_vars)
+            ),
         }
 
     def get(self, key: str, default: Any = None) -> Any:
@@ -119,13 +130,11 @@ class TestConfig:
         return str(safe_config)
 
 
-# Global config instance
-_config = None
-
-
+@functools.lru_cache(maxsize=1)
 def get_config() -> TestConfig:
-    """Get global config instance (singleton)"""
-    global _config
-    if _config is None:
-        _config = TestConfig()
-    return _config
+    """Get global config instance (singleton)
+
+    The .env file is read once per process; call get_config.cache_clear()
+    to force a reload.
+    """
+    return TestConfig()
@@ -2,11 +2,21 @@
 Common helper functions for E2E tests
 """
 
+import io
+import os
+import re
+import sys
 import tempfile
+import time
+import uuid
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Iterator, Optional, Tuple
 
 from playwright.sync_api import Locator, Page
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from e2e.common.config import get_config
 
 # ========================================
 # CONSTANTS
@@ -14,21 +24,84 @@ from playwright.sync_api import Locator, Page
 
 LABEL_OR_PLACEHOLDER_REQUIRED_ERROR = "Either 'label' or 'placeholder' must be provided"
 
+# Canonical selector for a Naive UI tab by its label - format with tab_name
+TAB_SELECTOR = '.n-tabs-tab:has-text("{tab_name}")'
+
+# Accessible names of the modal save button and the delete confirmation button
+SAVE_BUTTON_NAME = re.compile(r"^\s*(Create|Update|Save)\b")
+CONFIRM_BUTTON_NAME = re.compile(r"^\s*(Confirm|Delete|Yes)\b")
+
+# Class Naive UI adds to an expanded collapse item
+COLLAPSE_ACTIVE_CLASS = re.compile(r"\bn-collapse-item--active\b")
+
+# Timeout for optional elements that a helper skips when they do not appear
+OPTIONAL_ELEMENT_TIMEOUT_MS = 2000
+
+# Sets text input/textarea values by form label and returns labels not found
+FILL_FORM_SCRIPT = """
+(fields) => {
+    const items = Array.from(document.querySelectorAll(".n-form-item"));
+    const missing = [];
+    for (const [label, value] of Object.entries(fields)) {
+        const item = items.find((el) =>
+            el.querySelector(".n-form-item-label")?.textContent.includes(label)
+        );
+        const field = item?.querySelector("input, textarea");
+        if (!field) {
+            missing.push(label);
+            continue;
+        }
+        field.value = value;
+        field.dispatchEvent(new Event("input", { bubbles: true }));
+        field.dispatchEvent(new Event("change", { bubbles: true }));
+    }
+    return missing;
+}
+"""
+
 # ========================================
 # SCREENSHOT AND PAGE HELPERS
 # ========================================
 
 
+def get_screenshot_dir() -> Path:
+    """Return the TEST_SCREENSHOT_DIR directory, falling back to the system temp directory"""
+    return Path(get_config()["screenshot_dir"] or tempfile.gettempdir())
+
+
 def take_screenshot(page, name, description=""):
-    """Take a screenshot with consistent naming"""
-    temp_dir = Path(tempfile.gettempdir())
-    path = temp_dir / f"test_{name}.png"
+    """Take a screenshot with consistent naming (suffixed per pytest-xdist worker)
+
+    Files go to TEST_SCREENSHOT_DIR under a fixed name per step, so each run
+    overwrites the previous run's images instead of adding new ones.
+    """
+    screenshot_dir = get_screenshot_dir()
+    screenshot_dir.mkdir(parents=True, exist_ok=True)
+    path = screenshot_dir / f"test_{name}{worker_suffix()}.png"
     page.screenshot(path=str(path))
     if description:
         print(f"   [SCREENSHOT] {description}: {path}")
     return str(path)
 
 
+def take_step_screenshot(page, name, description=""):
+    """Take a success-path screenshot only when TEST_STEP_SCREENSHOTS is enabled
+
+    Failure screenshots should keep using take_screenshot() directly.
+    """
+    if get_config()["step_screenshots"]:
+        take_screenshot(page, name, description)
+
+
+def print_screenshot_location(prefix: str) -> None:
+    """Print where a test's screenshots were saved
+
+    Args:
+        prefix: Screenshot name prefix used by the test (e.g., "paints")
+    """
+    print(f"\nScreenshots saved to {get_screenshot_dir() / f'test_{prefix}_*.png'}")
+
+
 def wait_for_page_load(page):
     """Wait for page to fully load"""
     page.wait_for_load_state("networkidle")
@@ -54,7 +127,7 @@ def fill_text_input(
     placeholder: Optional[str] = None,
     value: Optional[str] = None,
     label: Optional[str] = None,
-    wait_ms: int = 200,
+    wait_ms: int = 0,
 ):
     """Fill a text input field by label (preferred) or placeholder (fallback)
 
@@ -63,7 +136,7 @@ def fill_text_input(
         placeholder: Input placeholder text (partial match, case-insensitive)
         value: Value to fill
         label: Form label text to identify the input (preferred method)
-        wait_ms: Wait time in milliseconds
+        wait_ms: Optional extra wait in milliseconds (fill is actionability-checked)
     """
     if label:
         # Find the form item by label text
@@ -76,7 +149,8 @@ def fill_text_input(
         raise ValueError(LABEL_OR_PLACEHOLDER_REQUIRED_ERROR)
 
     input_field.fill(value or "")
-    page.wait_for_timeout(wait_ms)
+    if wait_ms:
+        page.wait_for_timeout(wait_ms)
 
 
 def fill_text_input_exact(
@@ -85,7 +159,7 @@ def fill_text_input_exact(
     value: Optional[str] = None,
     label: Optional[str] = None,
     exact: bool = True,
-    wait_ms: int = 200,
+    wait_ms: int = 0,
 ):
     """Fill a text input field by label (preferred) or exact placeholder match (fallback)
 
@@ -95,7 +169,7 @@ def fill_text_input_exact(
         value: Value to fill
         label: Form label text to identify the input (preferred method)
         exact: Whether to use exact match for placeholder (default: True)
-        wait_ms: Wait time in milliseconds
+        wait_ms: Optional extra wait in milliseconds (fill is actionability-checked)
     """
     if label:
         # Find the form item by label text
@@ -111,7 +185,8 @@ def fill_text_input_exact(
         raise ValueError(LABEL_OR_PLACEHOLDER_REQUIRED_ERROR)
 
     input_field.fill(value or "")
-    page.wait_for_timeout(wait_ms)
+    if wait_ms:
+        page.wait_for_timeout(wait_ms)
 
 
 def fill_textarea(
@@ -119,7 +194,7 @@ def fill_textarea(
     placeholder: Optional[str] = None,
     value: Optional[str] = None,
     label: Optional[str] = None,
-    wait_ms: int = 200,
+    wait_ms: int = 0,
 ):
     """Fill a textarea field by label (preferred) or placeholder (fallback)
 
@@ -128,7 +203,7 @@ def fill_textarea(
         placeholder: Textarea placeholder text (partial match, case-insensitive)
         value: Value to fill
         label: Form label text to identify the textarea (preferred method)
-        wait_ms: Wait time in milliseconds
+        wait_ms: Optional extra wait in milliseconds (fill is actionability-checked)
     """
     if label:
         # Find the form item by label text
@@ -141,7 +216,8 @@ def fill_textarea(
         raise ValueError(LABEL_OR_PLACEHOLDER_REQUIRED_ERROR)
 
     textarea.fill(value or "")
-    page.wait_for_timeout(wait_ms)
+    if wait_ms:
+        page.wait_for_timeout(wait_ms)
 
 
 def fill_number_input(
@@ -149,7 +225,7 @@ def fill_number_input(
     placeholder: Optional[str] = None,
     value: Optional[int | str] = None,
     label: Optional[str] = None,
-    wait_ms: int = 200,
+    wait_ms: int = 0,
 ):
     """Fill a number input field by label (preferred) or placeholder (fallback)
 
@@ -158,7 +234,7 @@ def fill_number_input(
         placeholder: Input placeholder text (partial match, case-insensitive)
         value: Numeric value to fill
         label: Form label text to identify the input (preferred method)
-        wait_ms: Wait time in milliseconds
+        wait_ms: Optional extra wait in milliseconds (fill is actionability-checked)
     """
     if label:
         # Find the form item by label text
@@ -171,7 +247,23 @@ def fill_number_input(
         raise ValueError(LABEL_OR_PLACEHOLDER_REQUIRED_ERROR)
 
     input_field.fill(str(value) if value is not None else "")
-    page.wait_for_timeout(wait_ms)
+    if wait_ms:
+        page.wait_for_timeout(wait_ms)
+
+
+def fill_form(page: Page, fields: dict[str, str]):
+    """Fill several text inputs/textareas by form label in a single browser call
+
+    Dispatches input/change events so v-model picks up the values. Only for
+    plain NInput fields - number, date and select components still need their
+    dedicated helpers.
+
+    Args:
+        page: Playwright page object
+        fields: Mapping of form label text to value
+    """
+    missing = page.evaluate(FILL_FORM_SCRIPT, fields)
+    assert not missing, f"Form fields not found: {', '.join(missing)}"
 
 
 def fill_date_input(
@@ -179,7 +271,7 @@ def fill_date_input(
     label: Optional[str] = None,
     date_value: Optional[str] = None,
     index: Optional[int] = None,
-    wait_ms: int = 200,
+    wait_ms: int = 0,
 ):
     """Fill a date input field by label or index
 
@@ -188,28 +280,32 @@ def fill_date_input(
         label: Form label text to identify the date picker (e.g., "Issue Date", "Expiry Date")
         date_value: Date in format "YYYY-MM-DD"
         index: Fallback index of date picker (0-based) if label not provided
-        wait_ms: Wait time in milliseconds
+        wait_ms: Optional extra wait in milliseconds (fill is actionability-checked)
     """
     if label:
         # Find the form item by label text
         form_item = page.locator(f'.n-form-item:has(.n-form-item-label:has-text("{label}"))').first
         date_input = form_item.locator('input[placeholder*="Select Date" i]').first
-        if date_input.count() > 0:
-            date_input.fill(date_value or "")
+        try:
+            date_input.fill(date_value or "", timeout=OPTIONAL_ELEMENT_TIMEOUT_MS)
+        except PlaywrightTimeoutError:
+            return False
+        if wait_ms:
             page.wait_for_timeout(wait_ms)
-            return True
+        return True
     elif index is not None:
         # Fallback to index-based selection
         date_inputs = page.locator('input[placeholder*="Select Date" i]')
         if date_inputs.count() > index:
             date_inputs.nth(index).fill(date_value or "")
-            page.wait_for_timeout(wait_ms)
+            if wait_ms:
+                page.wait_for_timeout(wait_ms)
             return True
     return False
 
 
 def select_dropdown_option(
-    page: Page, modal, option_index: int = 0, label: Optional[str] = None, wait_ms: int = 300
+    page: Page, modal, option_index: int = 0, label: Optional[str] = None, wait_ms: int = 0
 ):
     """Select an option from a dropdown (NSelect component)
 
@@ -218,7 +314,7 @@ def select_dropdown_option(
         modal: Modal locator
         option_index: Index of option to select (default: 0)
         label: Optional label text to identify specific dropdown (e.g., "Theme", "Difficulty")
-        wait_ms: Wait time in milliseconds
+        wait_ms: Optional extra wait in milliseconds (the option click waits for the menu)
     """
     if label:
         # Find the form item by label text (in .n-form-item-label element)
@@ -229,15 +325,15 @@ def select_dropdown_option(
         dropdown = modal.locator(".n-select").first
 
     dropdown.click()
-    page.wait_for_timeout(wait_ms)
 
     options = page.locator(".n-base-select-option")
     options.nth(option_index).click()
-    page.wait_for_timeout(200)
+    if wait_ms:
+        page.wait_for_timeout(wait_ms)
 
 
 def fill_color_picker(
-    page: Page, modal, hex_color: str, label: Optional[str] = None, wait_ms: int = 300
+    page: Page, modal, hex_color: str, label: Optional[str] = None, wait_ms: int = 0
 ):
     """Fill the color picker with a hex color value
 
@@ -246,8 +342,10 @@ def fill_color_picker(
         modal: Modal locator
         hex_color: Hex color value (e.g., "#FF5733")
         label: Form label text to identify the color picker (optional)
-        wait_ms: Wait time in milliseconds
+        wait_ms: Optional extra wait in milliseconds (the picker panel is awaited)
     """
+    from playwright.sync_api import expect
+
     if label:
         # Find the form item by label text
         form_item = modal.locator(f'.n-form-item:has(.n-form-item-label:has-text("{label}"))').first
@@ -256,19 +354,19 @@ def fill_color_picker(
         # Fallback to first color picker in modal
         color_picker = modal.locator(".n-color-picker__fill").first
 
-    # Open color picker
+    # Open color picker (the fill below waits for the panel's hex input)
     color_picker.click()
-    page.wait_for_timeout(wait_ms)
 
     # Fill hex value
     hex_input = page.locator('input[placeholder*="HEX" i]').first
     hex_input.fill(hex_color)
-    page.wait_for_timeout(200)
 
-    # Confirm color selection
-    confirm_btn = page.locator('button:has-text("Confirm")').first
+    # Confirm color selection and wait for the panel to close
+    confirm_btn = page.get_by_role("button", name="Confirm", exact=True).first
     confirm_btn.click()
-    page.wait_for_timeout(wait_ms)
+    expect(confirm_btn).to_be_hidden()
+    if wait_ms:
+        page.wait_for_timeout(wait_ms)
 
 
 def upload_file(page: Page, modal, file_path: str, wait_ms: int = 1000):
@@ -281,7 +379,8 @@ def upload_file(page: Page, modal, file_path: str, wait_ms: int = 1000):
         upload_dragger.click()
     file_chooser = fc_info.value
     file_chooser.set_files(file_path)
-    page.wait_for_timeout(wait_ms)
+    if wait_ms:
+        page.wait_for_timeout(wait_ms)
 
 
 def remove_uploaded_file(page: Page, modal, button_text: str = "Remove Image", wait_ms: int = 500):
@@ -290,11 +389,12 @@ def remove_uploaded_file(page: Page, modal, button_text: str = "Remove Image", w
     remove_btn = modal.locator(
         f'button.n-button--small-type.n-button--error-type:has-text("{button_text}")'
     ).first
-    if remove_btn.count() > 0:
-        remove_btn.click()
-        page.wait_for_timeout(wait_ms)
-        return True
-    return False
+    try:
+        remove_btn.click(timeout=OPTIONAL_ELEMENT_TIMEOUT_MS)
+    except PlaywrightTimeoutError:
+        return False
+    page.wait_for_timeout(wait_ms)
+    return True
 
 
 def verify_file_uploaded(modal, file_name: str | None = None):
@@ -329,7 +429,7 @@ def confirm_image_crop(page: Page, modal_title: str, button_text: str, wait_ms:
     expect(cropper_modal).to_be_visible(timeout=5000)
 
     # Click the confirm/upload button
-    upload_btn = cropper_modal.locator(f'button:has-text("{button_text}")').first
+    upload_btn = cropper_modal.get_by_role("button", name=button_text).first
     upload_btn.click()
 
     # Wait for upload to complete and modal to close
@@ -345,20 +445,23 @@ def search_table(page: Page, search_term: str, wait_ms: int = 500):
     """Search in the table using the search input"""
     # Target SearchInput component by class and placeholder
     search_input = page.locator('.search-input input[placeholder*="Search" i]').first
-    if search_input.count() > 0:
-        search_input.fill(search_term)
-        page.wait_for_timeout(wait_ms)
-    else:
+    try:
+        search_input.fill(search_term, timeout=OPTIONAL_ELEMENT_TIMEOUT_MS)
+    except PlaywrightTimeoutError:
         print("   [WARN] Search input not found")
+        return
+    page.wait_for_timeout(wait_ms)
 
 
 def clear_search(page: Page, wait_ms: int = 500):
     """Clear the search input"""
     # Target SearchInput component by class and placeholder
     search_input = page.locator('.search-input input[placeholder*="Search" i]').first
-    if search_input.count() > 0:
-        search_input.fill("")
-        page.wait_for_timeout(wait_ms)
+    try:
+        search_input.fill("", timeout=OPTIONAL_ELEMENT_TIMEOUT_MS)
+    except PlaywrightTimeoutError:
+        return
+    page.wait_for_timeout(wait_ms)
 
 
 # ========================================
@@ -366,51 +469,74 @@ def clear_search(page: Page, wait_ms: int = 500):
 # ========================================
 
 
-def open_add_modal(page: Page, button_text: str, wait_ms: int = 500):
+def open_add_modal(page: Page, button_text: str):
     """Open an Add modal by button text (e.g., 'Add Paint', 'Add Skill')"""
-    # Target primary button with exact text (AddButton component)
-    add_btn = page.locator(f'button.n-button--primary-type:has-text("{button_text}")').first
-    assert add_btn.count() > 0, f"{button_text} button not found"
-    add_btn.click()
-    page.wait_for_timeout(wait_ms)
+    from playwright.sync_api import expect
+
+    # Target the AddButton component by its accessible name
+    add_btn = page.get_by_role("button", name=button_text).first
+    try:
+        add_btn.click(timeout=5000)
+    except PlaywrightTimeoutError as e:
+        raise AssertionError(f"{button_text} button not found") from e
 
     # Target Naive UI modal dialog
     modal = page.locator('.n-modal[role="dialog"]')
-    assert modal.count() > 0, "Modal not opened"
+    expect(modal).to_be_visible()
     return modal
 
 
-def close_modal(page: Page, wait_ms: int = 300):
-    """Close the modal by clicking Cancel"""
+def close_modal(page: Page, wait_ms: int = 300, modal: Optional[Locator] = None):
+    """Close the modal by clicking Cancel
+
+    Args:
+        page: Playwright page object
+        wait_ms: Fixed wait after clicking when no modal is given
+        modal: Modal locator to wait on; when provided, waits until it is
+            hidden instead of sleeping
+    """
+    from playwright.sync_api import expect
+
     # Target Cancel button within modal footer (ModalFooter component)
-    cancel_btn = page.locator('.n-modal button:has-text("Cancel")').first
+    cancel_btn = page.locator(".n-modal").get_by_role("button", name="Cancel").first
     cancel_btn.click()
-    page.wait_for_timeout(wait_ms)
+    if modal is not None:
+        expect(modal).to_be_hidden()
+    else:
+        page.wait_for_timeout(wait_ms)
 
 
-def save_modal(page: Page, wait_ms: int = 1000):
-    """Save/Create/Update in the modal"""
-    # Target primary button in modal footer (ModalFooter component - Create/Update button)
-    save_btn = page.locator(
-        '.n-modal button.n-button--primary-type:has-text("Create"), '
-        '.n-modal button.n-button--primary-type:has-text("Update"), '
-        '.n-modal button.n-button--primary-type:has-text("Save")'
-    ).first
+def save_modal(page: Page, wait_ms: int = 1000, modal: Optional[Locator] = None):
+    """Save/Create/Update in the modal
+
+    Args:
+        page: Playwright page object
+        wait_ms: Fixed wait after clicking when no modal is given
+        modal: Modal locator expected to close on a successful save; when
+            provided, waits until it is hidden instead of sleeping
+    """
+    from playwright.sync_api import expect
+
+    # Target the Create/Update/Save button in the modal footer (ModalFooter component)
+    save_btn = page.locator(".n-modal").get_by_role("button", name=SAVE_BUTTON_NAME).first
     save_btn.click()
-    page.wait_for_timeout(wait_ms)
+    if modal is not None:
+        expect(modal).to_be_hidden()
+    else:
+        page.wait_for_timeout(wait_ms)
 
 
-def open_edit_modal(page: Page, row_identifier: str, wait_ms: int = 500):
+def open_edit_modal(page: Page, row_identifier: str):
     """Open the edit modal for a specific row by text identifier"""
-    row = find_table_row(page, row_identifier)
+    from playwright.sync_api import expect
+
     # Target small button with Edit aria-label (createActionsRenderer creates these)
-    edit_btn = row.locator('button.n-button--small-type[aria-label*="Edit" i]').first
+    edit_btn = find_row_action_button(page, row_identifier, "Edit")
     edit_btn.click()
-    page.wait_for_timeout(wait_ms)
 
     # Target Naive UI modal dialog
     modal = page.locator('.n-modal[role="dialog"]')
-    assert modal.is_visible(), "Edit modal should be visible"
+    expect(modal).to_be_visible()
     return modal
 
 
@@ -425,23 +551,44 @@ def find_table_row(page: Page, row_identifier: str):
     return page.locator(f'.n-data-table tbody tr:has-text("{row_identifier}")')
 
 
-def delete_row(page: Page, row_identifier: str, wait_ms: int = 500):
-    """Delete a row with confirmation"""
-    row = find_table_row(page, row_identifier)
+def find_row_action_button(page: Page, row_identifier: str, action: str) -> Locator:
+    """Find a row action button (Edit, Delete) by its accessible name
+
+    Args:
+        page: Playwright page object
+        row_identifier: Text to identify the row
+        action: Action name matched against the button aria-label
+    """
+    return find_table_row(page, row_identifier).get_by_role("button", name=action).first
+
+
+def delete_row(page: Page, row_identifier: str, wait_ms: int = 0):
+    """Delete a row with confirmation and wait until it leaves the table
+
+    Args:
+        page: Playwright page object
+        row_identifier: Text to identify the row
+        wait_ms: Optional extra wait before confirming (the confirm click waits
+            for the dialog button)
+    """
+    from playwright.sync_api import expect
+
     # Target small error-type button with Delete aria-label (createActionsRenderer creates these)
-    delete_btn = row.locator('button.n-button--small-type[aria-label*="Delete" i]').first
+    delete_btn = find_row_action_button(page, row_identifier, "Delete")
     delete_btn.click()
-    page.wait_for_timeout(wait_ms)
+    if wait_ms:
+        page.wait_for_timeout(wait_ms)
 
-    # Confirm deletion in dialog
-    confirm_btn = page.locator(
-        '.n-dialog button:has-text("Confirm"), '
-        '.n-dialog button:has-text("Delete"), '
-        '.n-dialog button:has-text("Yes")'
-    ).first
-    if confirm_btn.count() > 0:
-        confirm_btn.click()
-        page.wait_for_timeout(1000)
+    # Confirm deletion in dialog (scoped to the dialog, first matching button)
+    confirm_btn = page.locator(".n-dialog").get_by_role("button", name=CONFIRM_BUTTON_NAME).first
+    try:
+        confirm_btn.click(timeout=OPTIONAL_ELEMENT_TIMEOUT_MS)
+    except PlaywrightTimeoutError:
+        print("   [WARN] Delete confirmation dialog not found")
+        return
+
+    # One polled check on the final state instead of a fixed settle wait
+    expect(find_table_row(page, row_identifier)).to_have_count(0)
 
 
 # ========================================
@@ -449,47 +596,98 @@ def delete_row(page: Page, row_identifier: str, wait_ms: int = 500):
 # ========================================
 
 
-def navigate_to_page(page: Page, base_url: str, route: str, wait_ms: int = 500):
+def navigate_to_page(
+    page: Page,
+    base_url: str,
+    route: str,
+    wait_ms: int = 500,
+    wait_until: str = "networkidle",
+):
     """Navigate to a specific page
 
     Args:
         page: Playwright page object
         base_url: Base URL (e.g., "http://localhost:3000")
         route: Route to navigate to (e.g., "certifications", "work-experience")
-        wait_ms: Wait time after navigation
+        wait_ms: Wait time after navigation (0 to skip)
+        wait_until: Load state passed to page.goto(); use "domcontentloaded"
+            when the caller waits on a specific element instead
     """
-    page.goto(f"{base_url}/{route}")
-    page.wait_for_load_state("networkidle")
-    page.wait_for_timeout(wait_ms)
+    page.goto(f"{base_url}/{route}", wait_until=wait_until)
+    if wait_ms:
+        page.wait_for_timeout(wait_ms)
 
 
-def navigate_to_tab(page: Page, base_url: str, route: str, tab_name: str, wait_ms: int = 500):
-    """Navigate to a specific page and click a tab"""
-    page.goto(f"{base_url}/{route}")
-    page.wait_for_load_state("networkidle")
-    page.wait_for_timeout(wait_ms)
+def navigate_to_tab(
+    page: Page,
+    base_url: str,
+    route: str,
+    tab_name: str,
+    wait_ms: int = 500,
+    wait_until: str = "networkidle",
+):
+    """Navigate to a specific page and click a tab
+
+    Args:
+        page: Playwright page object
+        base_url: Base URL (e.g., "http://localhost:3000")
+        route: Route to navigate to (e.g., "miniatures", "skills")
+        tab_name: Tab label to click
+        wait_ms: Wait time after navigation and after the tab click (0 to skip)
+        wait_until: Load state passed to page.goto(); use "domcontentloaded"
+            when the caller waits on a specific element instead
+    """
+    page.goto(f"{base_url}/{route}", wait_until=wait_until)
+    if wait_ms:
+        page.wait_for_timeout(wait_ms)
+    switch_tab(page, tab_name, wait_ms)
+
+
+def switch_tab(page: Page, tab_name: str, wait_ms: int = 500):
+    """Click a tab on the current page without reloading it
 
+    Switching away and back remounts the tab content, which re-fetches its
+    data from the API while keeping the loaded SPA bundle. Clicking the
+    already active tab is a no-op in NTabs, so that click and wait are skipped.
+    """
     # Target the tab by its label within the n-tabs-tab structure
-    tab = page.locator(f'.n-tabs-tab:has-text("{tab_name}")').first
+    tab = page.locator(TAB_SELECTOR.format(tab_name=tab_name)).first
     # Wait for tab to be visible before clicking
     tab.wait_for(state="visible", timeout=5000)
+    if "n-tabs-tab--active" in (tab.get_attribute("class") or ""):
+        return
     tab.click()
-    page.wait_for_timeout(wait_ms)
+    if wait_ms:
+        page.wait_for_timeout(wait_ms)
 
 
-def expand_collapse_section(page: Page, section_name: str, wait_ms: int = 300):
-    """Expand a collapsed section by clicking its header"""
+def expand_collapse_section(page: Page, section_name: str, wait_ms: int = 0):
+    """Expand a collapsed section by clicking its header
+
+    Args:
+        page: Playwright page object
+        section_name: Collapse item title (e.g., "Timeline")
+        wait_ms: Optional extra wait in milliseconds (the expanded state is awaited)
+    """
+    from playwright.sync_api import expect
+
     # Target n-collapse-item header by title text
     collapse_header = page.locator(
         f'.n-collapse-item:has-text("{section_name}") .n-collapse-item__header'
     ).first
-    if collapse_header.count() > 0:
-        # Check if already expanded by looking for the expanded class
-        parent_item = page.locator(f'.n-collapse-item:has-text("{section_name}")').first
-        is_expanded = "n-collapse-item--active" in (parent_item.get_attribute("class") or "")
-
-        if not is_expanded:
-            collapse_header.click()
+    try:
+        collapse_header.wait_for(state="visible", timeout=OPTIONAL_ELEMENT_TIMEOUT_MS)
+    except PlaywrightTimeoutError:
+        return
+
+    # Check if already expanded by looking for the expanded class
+    parent_item = page.locator(f'.n-collapse-item:has-text("{section_name}")').first
+    is_expanded = "n-collapse-item--active" in (parent_item.get_attribute("class") or "")
+
+    if not is_expanded:
+        collapse_header.click()
+        expect(parent_item).to_have_class(COLLAPSE_ACTIVE_CLASS)
+        if wait_ms:
             page.wait_for_timeout(wait_ms)
 
 
@@ -532,6 +730,20 @@ def click_dashboard_card_button(page: Page, card_title: str, button_text: str, w
 # ========================================
 
 
+def get_input(page: Page, label: str):
+    """Get the input locator of a form field by label
+
+    Args:
+        page: Playwright page object
+        label: Form label text to identify the input
+
+    Returns:
+        Locator: The field's first input element
+    """
+    form_item = page.locator(f'.n-form-item:has(.n-form-item-label:has-text("{label}"))').first
+    return form_item.locator("input").first
+
+
 def get_input_value(page: Page, label: str):
     """Get the current value of an input field by label
 
@@ -542,9 +754,7 @@ def get_input_value(page: Page, label: str):
     Returns:
         str: Current input value
     """
-    form_item = page.locator(f'.n-form-item:has(.n-form-item-label:has-text("{label}"))').first
-    input_field = form_item.locator("input").first
-    return input_field.input_value()
+    return get_input(page, label).input_value()
 
 
 def get_textarea_value(page: Page, label: str):
@@ -581,7 +791,7 @@ def verify_row_exists(page: Page, identifier: str, entity_name: str = "entry", t
     """
     from playwright.sync_api import expect
 
-    row = page.locator(f'tr:has-text("{identifier}")').first
+    row = find_table_row(page, identifier).first
     expect(row).to_be_visible(timeout=timeout)
     print(f"   [OK] {entity_name} '{identifier}' found in table")
     return row
@@ -597,7 +807,7 @@ def verify_row_not_exists(page: Page, identifier: str, entity_name: str = "entry
     """
     from playwright.sync_api import expect
 
-    row = page.locator(f'tr:has-text("{identifier}")').first
+    row = find_table_row(page, identifier).first
     expect(row).not_to_be_visible()
     print(f"   [OK] {entity_name} '{identifier}' not found in table")
 
@@ -637,12 +847,160 @@ def verify_cell_contains(row, text: str, description: str | None = None):
         bool: True if cell with text found
     """
     cell = row.locator(f'td:has-text("{text}")').first
-    found = cell.count() > 0
+    found = cell.is_visible()
     if found and description:
         print(f"   [OK] {description}")
     return found
 
 
+# ========================================
+# CRUD FLOW HELPERS
+# ========================================
+
+
+def submit_empty_form(page: Page, add_button_text: str, entity_name: str = "entry") -> Locator:
+    """Open an Add modal and check that saving it empty is blocked by validation
+
+    Args:
+        page: Playwright page object
+        add_button_text: Text of the Add button (e.g., "Add Paint")
+        entity_name: Name of entity for logging
+
+    Returns:
+        Locator: The still-open modal (caller closes it)
+    """
+    modal = open_add_modal(page, add_button_text)
+    print(f"   [OK] {add_button_text} modal opened")
+
+    # Try to save without filling required fields
+    save_modal(page)
+
+    # Modal should remain open due to validation
+    assert modal.is_visible(), "Modal should remain open on validation error"
+    print(f"   [OK] Validation prevents empty {entity_name} form submission")
+    return modal
+
+
+def verify_created_row(page: Page, identifier: str, entity_name: str = "entry"):
+    """Search for a newly created row, verify it is listed and clear the search
+
+    Args:
+        page: Playwright page object
+        identifier: Text to identify the row
+        entity_name: Name of entity for logging
+    """
+    search_and_verify(page, identifier, entity_name)
+    clear_search(page)
+
+
+def search_and_delete(page: Page, identifier: str):
+    """Narrow the table to a row by search and delete it with confirmation
+
+    Args:
+        page: Playwright page object
+        identifier: Text to identify the row
+    """
+    search_table(page, identifier)
+    delete_row(page, identifier)
+    print("   [OK] Deletion confirmed")
+
+
+def verify_row_deleted(page: Page, identifier: str, entity_name: str = "entry"):
+    """Search again for a deleted row, verify it is gone and clear the search
+
+    Args:
+        page: Playwright page object
+        identifier: Text to identify the row
+        entity_name: Name of entity for logging
+    """
+    clear_search(page)
+    search_table(page, identifier)
+    verify_row_not_exists(page, identifier, entity_name)
+    clear_search(page)
+
+
+# ========================================
+# API HELPERS
+# ========================================
+
+
+def fetch_api_items(
+    page: Page, api_url: str, resource: str, search: Optional[str] = None
+) -> list[dict]:
+    """Fetch a resource list from the admin API using the page's session
+
+    Args:
+        page: Playwright page object (its context cookies authenticate the request)
+        api_url: Admin API base URL (e.g., "http://localhost:8083")
+        resource: Resource path (e.g., "miniatures/paints")
+        search: Optional server-side search filter, so the record being checked
+            does not depend on landing on the default first page
+
+    Returns:
+        list: Items returned by the API
+    """
+    params = {"search": search} if search else None
+    response = page.request.get(f"{api_url}/{resource}", params=params)
+    assert response.ok, f"GET {resource} failed with status {response.status}"
+    body = response.json()
+    if isinstance(body, dict):
+        body = body.get("data", body.get("items", []))
+    return body or []
+
+
+def verify_api_record_exists(
+    page: Page,
+    api_url: str,
+    resource: str,
+    value: str,
+    field: str = "name",
+    entity_name: str = "entry",
+) -> dict:
+    """Verify that the admin API returns a record with a specific field value
+
+    Args:
+        page: Playwright page object
+        api_url: Admin API base URL
+        resource: Resource path (e.g., "miniatures/paints")
+        value: Expected field value
+        field: Record field to match (default: "name")
+        entity_name: Name of entity for logging
+
+    Returns:
+        dict: The matching record
+    """
+    items = fetch_api_items(page, api_url, resource, search=value)
+    record = next((item for item in items if item.get(field) == value), None)
+    assert record is not None, f"{entity_name} '{value}' not returned by API"
+    print(f"   [OK] {entity_name} '{value}' returned by API")
+    return record
+
+
+def verify_api_record_absent(
+    page: Page,
+    api_url: str,
+    resource: str,
+    value: str,
+    field: str = "name",
+    entity_name: str = "entry",
+) -> None:
+    """Verify that the admin API no longer returns a record with a specific field value
+
+    Args:
+        page: Playwright page object
+        api_url: Admin API base URL
+        resource: Resource path (e.g., "miniatures/themes")
+        value: Field value that should be gone
+        field: Record field to match (default: "name")
+        entity_name: Name of entity for logging
+    """
+    items = fetch_api_items(page, api_url, resource, search=value)
+    assert not any(
+        item.get(field) == value for item in items
+    ), f"{entity_name} '{value}' still returned by API"
+    print(f"   [OK] {entity_name} '{value}' no longer returned by API")
+
+
 # ========================================
 # PUBLIC-WEB HELPERS
 # ========================================
@@ -797,18 +1155,80 @@ def find_first_matching(
 
 
 def print_test_summary(test_name: str, passed_tests: list[str]) -> None:
-    """Print standardized test summary
+    """Print standardized test summary in a single write
 
     Args:
         test_name: Name of the test suite
         passed_tests: List of passed test descriptions
     """
-    print("\n" + "=" * 60)
-    print(f"=== {test_name} COMPLETED SUCCESSFULLY ===")
-    print("=" * 60)
-    print("\nTests performed:")
-    for test in passed_tests:
-        print(f"  [PASS] {test}")
+    lines = ["", "=" * 60, f"=== {test_name} COMPLETED SUCCESSFULLY ===", "=" * 60]
+    lines += ["", "Tests performed:"] + [f"  [PASS] {test}" for test in passed_tests]
+    print("\n".join(lines))
+
+
+def worker_suffix() -> str:
+    """Return a suffix identifying the pytest-xdist worker
+
+    Appended to generated test data names so parallel workers sharing one
+    backend never create or search for each other's rows.
+
+    Returns:
+        str: "_gw0", "_gw1", ... under pytest-xdist, "" otherwise
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    return f"_{worker}" if worker else ""
+
+
+def unique_name(prefix: str) -> str:
+    """Build a test data name unique per run and per pytest-xdist worker
+
+    Args:
+        prefix: Readable name prefix (e.g., "E2E Test Paint")
+
+    Returns:
+        str: e.g. "E2E Test Paint 1a2b3c4d_gw0"
+    """
+    return f"{prefix} {uuid.uuid4().hex[:8]}{worker_suffix()}"
+
+
+def buffer_stdout() -> None:
+    """Switch stdout from line buffering to block buffering
+
+    Progress lines are then written in batches instead of one flush per
+    line; Python still flushes the buffer when the process exits.
+    """
+    if isinstance(sys.stdout, io.TextIOWrapper):
+        sys.stdout.reconfigure(line_buffering=False)
+
+
+@contextmanager
+def timed(label: str, timings: Optional[dict[str, float]] = None) -> Iterator[None]:
+    """Measure and log the wall-clock duration of a test step
+
+    Args:
+        label: Step name for logging
+        timings: Optional dict that collects the duration (ms) under the label
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if timings is not None:
+            timings[label] = elapsed_ms
+        print(f"   [TIMING] {label}: {elapsed_ms:.0f}ms")
+
+
+def print_timing_summary(timings: dict[str, float]) -> None:
+    """Print per-step durations, slowest first, with the total
+
+    Args:
+        timings: Step durations in milliseconds collected by timed()
+    """
+    print("\nStep timings:")
+    for label, elapsed_ms in sorted(timings.items(), key=lambda item: item[1], reverse=True):
+        print(f"  {elapsed_ms:>7.0f}ms  {label}")
+    print(f"  {sum(timings.values()):>7.0f}ms  TOTAL")
 
 
 def verify_text_visible(page: Page, texts: list[str], name: str) -> bool:
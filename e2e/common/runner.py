@@ -0,0 +1,54 @@
+"""
+Standalone runner for fixture-based E2E tests
+
+Tests that take the shared ``authed_context`` fixture from e2e/conftest.py
+can still be executed directly (``python test_x.py``) by the suite runners
+and Taskfile through run_standalone().
+"""
+
+import sys
+import traceback
+from typing import Callable
+
+from playwright.sync_api import BrowserContext, sync_playwright
+
+from e2e.auth.auth_manager import AuthManager
+from e2e.common.browser import launch_browser, prepare_context
+
+
+def run_standalone(test_fn: Callable[[BrowserContext], None], persistent: bool = False) -> int:
+    """Launch a browser, authenticate and run a single test function
+
+    Args:
+        test_fn: Test function taking an authenticated browser context
+        persistent: Use the persistent browser profile instead of a fresh browser
+
+    Returns:
+        int: Process exit code (0 on success, 1 on failure)
+    """
+    auth_manager = AuthManager()
+
+    with sync_playwright() as p:
+        if persistent:
+            browser = None
+            page, context = auth_manager.authenticate_persistent(p, profile_name=test_fn.__name__)
+        else:
+            browser = launch_browser(p)
+            page, context = auth_manager.authenticate(browser, strategy="reuse")
+        page.close()
+        prepare_context(context)
+
+        try:
+            test_fn(context)
+            return 0
+        except Exception:
+            # The test saves its own error screenshot; report the failure once here,
+            # as pytest would when the test runs under the shared fixtures
+            traceback.print_exc(file=sys.stdout)
+            return 1
+        finally:
+            # Closing the browser closes its contexts; a persistent context owns its browser
+            if browser:
+                browser.close()
+            else:
+                context.close()
@@ -0,0 +1,87 @@
+"""
+Shared pytest fixtures for E2E tests
+
+One Chromium instance and one login are shared by the pytest session. Each
+test gets its own browser context restored from the saved auth storage state,
+so tests are isolated without repeating the login flow. Each test context is
+traced; the trace is only written to disk when the test fails.
+"""
+
+import pytest
+from playwright.sync_api import sync_playwright
+
+from e2e.auth.auth_manager import AuthManager
+from e2e.common.browser import launch_browser, prepare_context
+from e2e.common.config import get_config
+from e2e.common.helpers import get_screenshot_dir
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item):
+    """Expose each phase report on the test item (item.rep_setup, item.rep_call)"""
+    outcome = yield
+    report = outcome.get_result()
+    setattr(item, f"rep_{report.when}", report)
+
+
+@pytest.fixture(scope="session")
+def browser():
+    """Launch a single browser for the whole test session"""
+    with sync_playwright() as p:
+        browser = launch_browser(p)
+        yield browser
+        browser.close()
+
+
+@pytest.fixture(scope="session")
+def auth_state(browser):
+    """Authenticate once per session and return the storage state file path
+
+    The storage state saved by a previous run is reused while it is still
+    valid, skipping the login flow entirely. AuthManager saves the state
+    whenever it logs in or re-checks it.
+    """
+    auth_manager = AuthManager()
+    page, context = auth_manager.authenticate(browser, strategy="reuse")
+    page.close()
+    context.close()
+    return str(auth_manager.context_path)
+
+
+@pytest.fixture
+def authed_context(browser, auth_state):
+    """Fresh authenticated browser context per test, restored from storage state
+
+    Tests open their own page with ``authed_context.new_page()``.
+    """
+    context = browser.new_context(
+        storage_state=auth_state,
+        ignore_https_errors=get_config()["ignore_https_errors"],
+    )
+    prepare_context(context)
+    yield context
+    context.close()
+
+
+@pytest.fixture(autouse=True)
+def trace_on_failure(request):
+    """Record a Playwright trace per test and keep it only if the test failed
+
+    Traces are saved to <TEST_SCREENSHOT_DIR>/traces/<test name>.zip and can be
+    opened with ``playwright show-trace``.
+    """
+    if "authed_context" not in request.fixturenames:
+        yield
+        return
+
+    context = request.getfixturevalue("authed_context")
+    context.tracing.start(screenshots=True, snapshots=True, sources=True)
+    yield
+
+    report = getattr(request.node, "rep_call", None)
+    if report is not None and report.failed:
+        trace_path = get_screenshot_dir() / "traces" / f"{request.node.name}.zip"
+        context.tracing.stop(path=str(trace_path))
+        print(f"\n   [TRACE] Saved failure trace: {trace_path}")
+    else:
+        context.tracing.stop()
@@ -10,6 +10,7 @@ import traceback
 
 from playwright.sync_api import expect, sync_playwright
 
+from e2e.common.browser import launch_browser
 from e2e.common.config import get_config
 from e2e.common.helpers import (
     fill_text_input,
@@ -27,7 +28,7 @@ BASE_URL = config["public_web_url"]
 def test_contact_form():
     """Test contact form validation and interaction"""
     with sync_playwright() as p:
-        browser = p.chromium.launch(headless=config["headless"])
+        browser = launch_browser(p)
         context = browser.new_context(ignore_https_errors=config.get("ignore_https_errors", False))
         page = context.new_page()
 
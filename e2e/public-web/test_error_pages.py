@@ -9,6 +9,7 @@ import traceback
 
 from playwright.sync_api import expect, sync_playwright
 
+from e2e.common.browser import launch_browser
 from e2e.common.config import get_config
 from e2e.common.helpers import take_screenshot, wait_for_page_load
 
@@ -19,7 +20,7 @@ BASE_URL = config["public_web_url"]
 def test_error_pages():
     """Test error pages display correctly"""
     with sync_playwright() as p:
-        browser = p.chromium.launch(headless=config["headless"])
+        browser = launch_browser(p)
         context = browser.new_context(ignore_https_errors=config.get("ignore_https_errors", False))
         page = context.new_page()
 
@@ -23,7 +23,7 @@ class AdminTestRunner:
         self.end_time = None
 
     def run_test(self, test_path, test_name):
-        """Run a single test file"""
+        """Run a single test file, or a directory of fixture-based tests in one pytest session"""
         print("\n" + "=" * 70)
         print(f"Running: {test_name}")
         print("=" * 70)
@@ -32,8 +32,14 @@ class AdminTestRunner:
             env = os.environ.copy()
             env["PYTHONPATH"] = str(self.testing_dir)
 
+            if test_path.is_dir():
+                # One pytest session shares a single browser launch and login
+                cmd = [sys.executable, "-m", "pytest", "-q", "-s", str(test_path)]
+            else:
+                cmd = [sys.executable, str(test_path)]
+
             result = subprocess.run(
-                [sys.executable, str(test_path)],
+                cmd,
                 cwd=str(self.testing_dir),
                 capture_output=False,
                 timeout=300,
@@ -97,10 +103,8 @@ class AdminTestRunner:
                 base / "portfolio-projects" / "test_portfolio_projects_crud.py",
                 "Portfolio Projects CRUD",
             ),
-            # Miniatures CRUD tests
-            (base / "miniatures" / "test_paints_crud.py", "Miniatures Paints CRUD"),
-            (base / "miniatures" / "test_themes_crud.py", "Miniatures Themes CRUD"),
-            (base / "miniatures" / "test_projects_crud.py", "Miniatures Projects CRUD"),
+            # Miniatures CRUD tests (paints, themes, projects) in one pytest session
+            (base / "miniatures", "Miniatures CRUD"),
             # Messaging CRUD tests
             (base / "messaging" / "test_messaging_crud.py", "Messaging CRUD"),
             # RBAC tests